@@ -1,10 +1,40 @@
+import heapq
 from typing import List
 
-# There is a O(n) solution where one looks at the most expensive 2 * K elements.
-# Can be implemented with a heap.
 
+def getMinimumCostFast(books: List[int], paircost: int, K: int) -> int:
+    """
+    Calculate the same minimum cost as getMinimumCost in O(n log K) time.
+
+    Any 2m of the books, for m <= K, can be bought as m pairs: pair the leftmost
+    chosen book with the rightmost one, after buying the books outside them one by
+    one, and repeat inwards. So the cost is the total of all books, minus the
+    largest saving over such choices, where pairing books a and b saves
+    a + b - paircost. The best 2m books are the 2m most expensive ones, and pairing
+    them largest first, each pair saves no more than the one before, so pairs are
+    taken while they save anything. The cost is then summed from the books left
+    unpaired, as getMinimumCost does, so both return the same type.
+
+    Args:
+        books (List[int]): Array of costs for each book
+        paircost (int): Cost to buy both leftmost and rightmost books together
+        K (int): Maximum number of times option 3 can be used
 
-# The following is a O(n^2*k) solution to practice dynamic programming.
+    Returns:
+        int: The minimum possible cost to buy all the books
+    """
+    expensive = heapq.nlargest(min(2 * K, len(books)), range(len(books)), key=books.__getitem__)
+    pairs = 0
+    for a, b in zip(expensive[::2], expensive[1::2]):
+        if books[a] + books[b] <= paircost:
+            break
+        pairs += 1
+    paired = set(expensive[: 2 * pairs])
+    return sum(cost for i, cost in enumerate(books) if i not in paired) + pairs * paircost
+
+
+# The following is a O(n^2*k) solution to practice dynamic programming,
+# kept as a reference for getMinimumCostFast and getMinimumCostRolling.
 def getMinimumCost(books: List[int], paircost: int, K: int) -> int:
     """
     Calculate the minimum cost to buy all books with special purchasing rules.
@@ -38,7 +68,7 @@ def getMinimumCost(books: List[int], paircost: int, K: int) -> int:
             j = i + slen
             for k in range(K + 1):
                 options = set()
-                if k > 0 and i + 2 >= j:
+                if k > 0 and i + 2 <= j:
                     options.add(minCost[i + 1][j - 1][k - 1] + paircost)
                 options.add(minCost[i + 1][j][k] + books[i])
                 options.add(minCost[i][j - 1][k] + books[j - 1])
@@ -46,4 +76,48 @@ def getMinimumCost(books: List[int], paircost: int, K: int) -> int:
     return minCost[0][len(books)][K]
 
 
-print(getMinimumCost([4, 5, 6], 3, 3))
+def getMinimumCostRolling(books: List[int], paircost: int, K: int) -> int:
+    """
+    Calculate the same minimum cost as getMinimumCost with O(n * K) memory.
+
+    The cost for the books i..j - 1 only depends on the costs for subarrays one
+    and two books shorter, so iterating over the subarray length slen, only the
+    layers for slen - 1 and slen - 2 are kept. Each layer is a flat list where
+    the costs for the subarray starting at i, using up to k pairs, are at
+    i * (K + 1) + k, and a row of K + 1 costs is computed at once.
+
+    Args:
+        books (List[int]): Array of costs for each book
+        paircost (int): Cost to buy both leftmost and rightmost books together
+        K (int): Maximum number of times option 3 can be used
+
+    Returns:
+        int: The minimum possible cost to buy all the books
+    """
+    n, width = len(books), K + 1
+    # subarrays of length 0 and -1 (never used) cost nothing
+    shorter, shortest = [0] * ((n + 1) * width), [0] * ((n + 2) * width)
+    for slen in range(1, n + 1):
+        layer = [0] * ((n - slen + 1) * width)
+        for i in range(n - slen + 1):
+            row, next_row = i * width, (i + 1) * width
+            first, last = books[i], books[i + slen - 1]
+            # buy the leftmost book, or the rightmost one
+            costs = map(
+                min,
+                [cost + first for cost in shorter[next_row : next_row + width]],
+                [cost + last for cost in shorter[row : row + width]],
+            )
+            if slen >= 2:
+                # or buy both as a pair, using one of the k pairs
+                pairs = [cost + paircost for cost in shortest[next_row : next_row + K]]
+                costs = map(min, costs, [float("inf")] + pairs)
+            layer[row : row + width] = costs
+        shorter, shortest = layer, shorter
+    return shorter[K]
+
+
+if __name__ == "__main__":
+    print(getMinimumCost([4, 5, 6], 3, 3))
+    print(getMinimumCostFast([4, 5, 6], 3, 3))
+    print(getMinimumCostRolling([4, 5, 6], 3, 3))
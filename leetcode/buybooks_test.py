@@ -0,0 +1,62 @@
+"""
+Tests for buybooks.py
+"""
+
+import random
+import unittest
+from functools import lru_cache
+from buybooks import getMinimumCost, getMinimumCostFast, getMinimumCostRolling
+
+
+def brute_force(books, paircost, K):
+    # try every way of buying the books, one end or both ends at a time
+    @lru_cache(maxsize=None)
+    def cost(i, j, k):
+        if i == j:
+            return 0
+        options = [books[i] + cost(i + 1, j, k), books[j - 1] + cost(i, j - 1, k)]
+        if k > 0 and j - i >= 2:
+            options.append(paircost + cost(i + 1, j - 1, k - 1))
+        return min(options)
+
+    return cost(0, len(books), K)
+
+
+class TestBuyBooks(unittest.TestCase):
+
+    def check(self, books, paircost, K):
+        expected = brute_force(tuple(books), paircost, K)
+        for solve in (getMinimumCost, getMinimumCostFast, getMinimumCostRolling):
+            with self.subTest(solve=solve.__name__, books=books, paircost=paircost, K=K):
+                cost = solve(books, paircost, K)
+                self.assertAlmostEqual(cost, expected)
+                self.assertIs(type(cost), type(expected))
+
+    def test_matches_brute_force(self):
+        rng = random.Random(6006)
+        for _ in range(500):
+            books = [rng.randint(1, 20) for _ in range(rng.randint(0, 9))]
+            self.check(books, rng.randint(0, 30), rng.randint(0, 5))
+
+    def test_examples(self):
+        self.check([4, 5, 6], 3, 3)
+        # no pairs allowed
+        self.check([4, 5, 6], 3, 0)
+        # odd number of books, one of which is bought alone
+        self.check([9, 1, 9, 1, 9], 2, 3)
+        # pairs that cost more than their books
+        self.check([1, 2, 3, 4], 100, 2)
+        self.check([], 3, 2)
+
+    def test_float_prices(self):
+        # with every book paired the cost is the int paircost, for every solver
+        self.check([1.5, 2.5], 1, 1)
+        self.check([1.5, 2.5, 0.25], 1, 1)
+        rng = random.Random(1)
+        for _ in range(100):
+            books = [rng.randint(1, 80) / 4 for _ in range(rng.randint(1, 8))]
+            self.check(books, rng.randint(0, 30), rng.randint(0, 4))
+
+
+if __name__ == "__main__":
+    unittest.main()
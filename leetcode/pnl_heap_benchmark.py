@@ -0,0 +1,79 @@
+"""
+Compare the memory and time of a heapq list of (value, index) tuples
+with the CompactHeap of pnl.py.
+
+Usage: python pnl_heap_benchmark.py [n_entries]   (default 10**7)
+"""
+
+import random
+import sys
+import time
+import tracemalloc
+from heapq import heappop, heappush
+from pnl import CompactHeap, NegationPlanner
+
+
+def fill_tuple_heap(values):
+    heap = []
+    for i, value in enumerate(values):
+        heappush(heap, (value, i))
+    return heap
+
+
+def fill_compact_heap(values):
+    heap = CompactHeap()
+    for i, value in enumerate(values):
+        heap.push(value, i)
+    return heap
+
+
+def drain_tuple_heap(heap):
+    while heap:
+        heappop(heap)
+
+
+def drain_compact_heap(heap):
+    while heap:
+        heap.pop()
+
+
+def measure(name, fill, drain, values):
+    # time without tracing, which slows allocations down, then trace a refill
+    start = time.perf_counter()
+    heap = fill(values)
+    filled = time.perf_counter()
+    drain(heap)
+    drained = time.perf_counter()
+    tracemalloc.start()
+    heap = fill(values)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del heap
+    n = len(values)
+    print(
+        f"{name:<12} {size / n:>8.1f} B/entry {filled - start:>8.2f}s push "
+        f"{drained - filled:>8.2f}s pop"
+    )
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10**7
+    rng = random.Random(0)
+    # negative values like the planner stores, too large to be cached small ints
+    values = [-rng.randrange(1 << 40) for _ in range(n)]
+    print(f"{n} entries")
+    measure("tuple heap", fill_tuple_heap, drain_tuple_heap, values)
+    measure("CompactHeap", fill_compact_heap, drain_compact_heap, values)
+    pnl = [rng.randint(-100, 100) for _ in range(n)]
+    for compact in (False, True):
+        start = time.perf_counter()
+        planner = NegationPlanner(compact)
+        planner.extend(pnl)
+        print(
+            f"NegationPlanner(compact={compact}): {planner.count} negated "
+            f"in {time.perf_counter() - start:.2f}s"
+        )
+
+
+if __name__ == "__main__":
+    main()
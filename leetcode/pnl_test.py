@@ -0,0 +1,120 @@
+"""
+Tests for pnl.py
+"""
+
+import heapq
+import random
+import unittest
+from array import array
+from itertools import accumulate, product
+from pnl import (
+    CompactHeap,
+    NegationPlanner,
+    TupleHeap,
+    max_negative_entries,
+    max_negative_entries_batch,
+)
+
+
+class TestHeaps(unittest.TestCase):
+
+    def test_matches_heapq(self):
+        for heap_type in (TupleHeap, CompactHeap):
+            with self.subTest(heap_type.__name__):
+                self.check_matches_heapq(heap_type())
+
+    def check_matches_heapq(self, heap):
+        rng = random.Random(6006)
+        reference = []
+        for _ in range(2000):
+            if reference and rng.random() < 0.4:
+                self.assertEqual(heap.pop(), heapq.heappop(reference))
+            else:
+                # few distinct values, so that ties are broken by index
+                entry = (rng.randint(-20, 5), rng.randrange(1000))
+                heap.push(*entry)
+                heapq.heappush(reference, entry)
+            self.assertEqual(len(heap), len(reference))
+            if reference:
+                self.assertEqual(heap.peek(), reference[0])
+        drained = [heap.pop() for _ in range(len(heap))]
+        self.assertEqual(drained, sorted(reference))
+
+
+def brute_force(pnl):
+    # most negative entries over every choice of signs keeping the sums positive,
+    # None if no choice does
+    best = None
+    for signs in product((1, -1), repeat=len(pnl)):
+        values = [sign * abs(num) for sign, num in zip(signs, pnl)]
+        if all(total > 0 for total in accumulate(values)):
+            count = sum(value < 0 for value in values)
+            best = count if best is None else max(best, count)
+    return best
+
+
+class TestNegationPlanner(unittest.TestCase):
+
+    def test_matches_brute_force(self):
+        rng = random.Random(6006)
+        for _ in range(500):
+            pnl = [rng.randint(-6, 6) for _ in range(rng.randint(1, 9))]
+            best = brute_force(pnl)
+            if best is not None:
+                self.assertEqual(max_negative_entries(pnl), best)
+
+    def test_streaming(self):
+        rng = random.Random(1)
+        pnl = [rng.randint(-20, 20) for _ in range(300)]
+        pnl[0] = 50
+        planner = NegationPlanner()
+        for n, num in enumerate(pnl, 1):
+            self.assertEqual(planner.push(num), max_negative_entries(pnl[:n]))
+        # negating the planned entries, and only those, keeps every sum positive
+        negated = set(planner.negated_indices())
+        self.assertEqual(len(negated), planner.count)
+        values = [-abs(num) if i in negated else abs(num) for i, num in enumerate(pnl)]
+        self.assertTrue(all(total > 0 for total in accumulate(values)))
+
+    def test_examples(self):
+        self.assertEqual(max_negative_entries([5, -3, 1, 1, 1, 1]), 4)
+        self.assertEqual(max_negative_entries([1, -2]), 0)
+        self.assertEqual(max_negative_entries([5, 4, 1, 1, 1, 1, 1]), 5)
+        self.assertEqual(max_negative_entries([7, -3, -2, -1, -1, -1]), 4)
+
+    def test_floats(self):
+        self.assertEqual(max_negative_entries([1.5, -0.5]), 1)
+
+    def test_compact_matches_default(self):
+        rng = random.Random(6006)
+        pnl = [rng.randint(-100, 100) for _ in range(5000)]
+        planner, compact = NegationPlanner(), NegationPlanner(compact=True)
+        for num in pnl:
+            self.assertEqual(planner.push(num), compact.push(num))
+        self.assertEqual(planner.negated_indices(), compact.negated_indices())
+
+
+class TestBatch(unittest.TestCase):
+
+    def test_matches_max_negative_entries(self):
+        rng = random.Random(2)
+        series = [[rng.randint(-50, 50) for _ in range(rng.randint(0, 200))] for _ in range(40)]
+        # arrays are accepted as well as lists
+        series[1::2] = [array("q", pnl) for pnl in series[1::2]]
+        expected = [max_negative_entries(pnl) for pnl in series]
+        for workers in (1, 2):
+            for compact in (False, True):
+                with self.subTest(workers=workers, compact=compact):
+                    counts, masks = max_negative_entries_batch(
+                        series, workers=workers, with_masks=True, chunksize=3, compact=compact
+                    )
+                    self.assertEqual(list(counts), expected)
+                    self.assertEqual([len(mask) for mask in masks], [len(pnl) for pnl in series])
+                    self.assertEqual([sum(mask) for mask in masks], expected)
+            counts, masks = max_negative_entries_batch(series, workers=workers)
+            self.assertEqual(list(counts), expected)
+            self.assertIsNone(masks)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -21,15 +21,21 @@ Note: The code below the "READ, BUT DO NOT MODIFY CODE BELOW HERE" comment shoul
 
 from typing import Optional
 from random import randint
+from pocket_cube_stats import SearchStats, dict_bytes
 
 
-def basic_solve(config):
+def basic_solve(config, stats: Optional[SearchStats] = None):
     # Return a sequence of moves to solve config, or None if not possible
-    # Fully explore graph using BFS
-    parent, frontier = {config: None}, [config]
+    # Fully explore graph using BFS, recording the search in stats if given
+    if stats is not None:
+        search_started = stats.start("basic_solve")
+    parent, frontier, depth = {config: None}, [config], 0
     while len(frontier) != 0:
-        frontier = explore_frontier(frontier, parent, True)
+        depth += 1
+        frontier = explore_level(frontier, parent, stats, "forward", depth)
     print(f"Searched {len(parent)} reachable configurations")
+    if stats is not None:
+        stats.finish(search_started, len(parent), dict_bytes(parent))
     # Check whether solved state visited and reconstruct path
     if SOLVED in parent:
         path = path_to_config(SOLVED, parent)
@@ -37,20 +43,34 @@ def basic_solve(config):
     return None
 
 
-def solve(config: str) -> Optional[list[tuple[int, int]]]:
+def solve(
+    config: str, strategy: str = "bfs", stats: Optional[SearchStats] = None
+) -> Optional[list[tuple[int, int]]]:
     """
-    Solve the given configuration using a bidirectional BFS strategy.
+    Solve the given configuration, by default using a bidirectional BFS strategy.
 
     Args:
         config (str): The initial configuration to solve.
+        strategy (str): "bfs" for the bidirectional BFS, or "ida*" for a
+            depth-first IDA* search with bounded memory (see pocket_cube_ida).
+        stats (SearchStats, optional): Filled in with statistics of the search.
 
     Returns:
         list or None: A sequence of moves to solve the configuration, or None if it's unsolvable.
     """
+    if strategy == "ida*":
+        # imported here since pocket_cube_ida builds on this module
+        import pocket_cube_ida
+
+        return pocket_cube_ida.solve(config, stats)
+    if strategy != "bfs":
+        raise ValueError(f"Unknown strategy {strategy!r}")
+    if stats is not None:
+        search_started = stats.start("solve")
     # Explore graph using BFS from the query configuration
-    forward = bfs(config)  # BFS from the query configuration
+    forward = bfs(config, stats, "forward")  # BFS from the query configuration
     # Explore graph using BFS from the solved configuration
-    backward = bfs(SOLVED)  # BFS from the solved configuration
+    backward = bfs(SOLVED, stats, "backward")  # BFS from the solved configuration
     curr = forward
     other_parent = dict()
     while True:
@@ -68,6 +88,12 @@ def solve(config: str) -> Optional[list[tuple[int, int]]]:
         )  # Alternate between forward and backward BFS
         other_parent = parent  # Store parent pointers of the current BFS for comparison
     print(f"Searched {len(parent) + len(other_parent)} reachable configurations")
+    if stats is not None:
+        stats.finish(
+            search_started,
+            len(parent) + len(other_parent),
+            dict_bytes(parent) + dict_bytes(other_parent),
+        )
     if not common_configs:
         return None
     meet_config = common_configs.pop()  # Get the overlapping configuration
@@ -77,16 +103,31 @@ def solve(config: str) -> Optional[list[tuple[int, int]]]:
     bpath = path_to_config(
         meet_config, other_parent if curr is forward else parent
     )  # Path from overlap to solved
+    if stats is not None:
+        stats.meet_depth = (len(fpath) - 1, len(bpath) - 1)
     bpath.pop()  # Remove the overlap configuration from the backward path
     bpath.reverse()  # Reverse the backward path to get correct order
     return moves_from_path(fpath + bpath)  # Combine paths and convert to moves
 
 
-def bfs(config):
-    parent, frontier = {config: None}, [config]
+def bfs(config, stats: Optional[SearchStats] = None, direction: str = "forward"):
+    parent, frontier, depth = {config: None}, [config], 0
     while len(frontier) != 0:
         yield parent
-        frontier = explore_frontier(frontier, parent, True)
+        depth += 1
+        frontier = explore_level(frontier, parent, stats, direction, depth)
+
+
+def explore_level(frontier, parent, stats: Optional[SearchStats], direction: str, depth: int):
+    # Explore frontier as explore_frontier does, recording it in stats if given
+    if stats is None:
+        return explore_frontier(frontier, parent, True)
+    started = stats.clock()
+    new_frontier = explore_frontier(frontier, parent, True)
+    stats.record_level(
+        direction, depth, len(frontier), 6 * len(frontier), len(new_frontier), started
+    )
+    return new_frontier
 
 
 # --------------------------------------- #
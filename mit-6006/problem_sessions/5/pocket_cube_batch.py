@@ -0,0 +1,93 @@
+"""
+This module solves batches of Pocket Cube configurations in parallel.
+
+`solve_many` fans the configurations out over a pool of worker processes in
+chunks and streams the solutions back as soon as each chunk is done. Only
+the module of the chosen strategy is imported, and its tables are built, or
+in the case of `pocket_cube_db` memory-mapped, before the pool starts, so
+workers forked from the calling process share them instead of each
+building its own copy.
+"""
+
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from importlib import import_module
+from itertools import islice
+from typing import Callable, Iterable, Iterator, Optional
+
+# module whose solve function each strategy uses, imported on first use
+# since some of them take seconds to build their tables
+SOLVERS = {
+    "table": "pocket_cube_db",
+    "bfs": "pocket_cube_coords",
+    "symmetric": "pocket_cube_symmetry",
+    "ida*": "pocket_cube_ida",
+}
+
+Solution = tuple[int, Optional[list[tuple[int, int]]]]
+
+
+def get_solver(strategy: str) -> Callable[[str], Optional[list[tuple[int, int]]]]:
+    return import_module(SOLVERS[strategy]).solve
+
+
+def solve_chunk(strategy: str, start: int, configs: list[str]) -> list[Solution]:
+    # Solve configs, numbering them from start
+    solver = get_solver(strategy)
+    return [(start + i, solver(config)) for i, config in enumerate(configs)]
+
+
+def solve_many(
+    configs: Iterable[str],
+    workers: Optional[int] = None,
+    strategy: str = "table",
+    chunksize: int = 256,
+) -> Iterator[Solution]:
+    """
+    Solve many configurations in parallel.
+
+    Args:
+        configs (iterable): The configurations to solve, consumed lazily.
+        workers (int, optional): Number of worker processes,
+            by default the number of CPUs.
+        strategy (str): The solver to use, one of SOLVERS.
+        chunksize (int): Number of configurations sent to a worker at once.
+
+    Yields:
+        tuple: The index of a configuration in configs and its sequence of
+            moves (None if unsolvable), in the order the solutions complete.
+    """
+    if strategy not in SOLVERS:
+        raise ValueError(f"Unknown strategy {strategy!r}, expected one of {list(SOLVERS)}")
+    get_solver(strategy)
+    if strategy == "table":
+        import_module("pocket_cube_db").load_distance_table()
+    workers = workers or os.cpu_count() or 1
+    configs = iter(configs)
+    with ProcessPoolExecutor(workers) as pool:
+        # keep a bounded number of chunks in flight
+        max_pending = 2 * workers
+        pending, start = set(), 0
+        while True:
+            while len(pending) < max_pending:
+                chunk = list(islice(configs, chunksize))
+                if not chunk:
+                    break
+                pending.add(pool.submit(solve_chunk, strategy, start, chunk))
+                start += len(chunk)
+            if not pending:
+                return
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield from future.result()
+
+
+if __name__ == "__main__":
+    import time
+    from pocket_cube import SOLVED, check, scramble
+
+    scrambles = [scramble(SOLVED, 100) for _ in range(10000)]
+    begin = time.time()
+    results = dict(solve_many(scrambles))
+    print(f"Solved {len(results)} configurations in {time.time() - begin:.2f}s")
+    print("All checked:", all(check(scrambles[i], moves) for i, moves in results.items()))
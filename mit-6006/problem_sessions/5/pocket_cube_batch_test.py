@@ -0,0 +1,29 @@
+"""
+Tests for pocket_cube_batch.py
+"""
+
+import random
+import unittest
+import pocket_cube_coords as coords
+from pocket_cube import SOLVED, check
+from pocket_cube_batch import solve_many
+
+
+class TestPocketCubeBatch(unittest.TestCase):
+
+    def test_solve_many(self):
+        rng = random.Random(6006)
+        configs = [coords.decode(rng.randrange(coords.N_STATES)) for _ in range(20)]
+        configs.append(SOLVED)
+        results = dict(solve_many(configs, workers=2, strategy="bfs", chunksize=3))
+        self.assertEqual(sorted(results), list(range(len(configs))))
+        for i, moves in results.items():
+            self.assertTrue(check(configs[i], moves))
+
+    def test_unknown_strategy(self):
+        with self.assertRaises(ValueError):
+            list(solve_many([SOLVED], strategy="dfs"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,437 @@
+"""
+This module solves Pocket Cube configurations on integer-encoded states.
+
+Only faces 0, 1 and 2 are ever rotated, so the corner shared by the other
+three faces never moves. A configuration is therefore determined by which
+of the remaining 7 corner cubies sits at each of the 7 other corner
+positions, and how it is twisted there. That pair is ranked into a single
+integer code in range(N_STATES), and each of the 6 moves becomes two
+lookups in precomputed tables instead of a rewrite of a 24 character string.
+
+Configuration strings are only decoded again to report the final path,
+in the same (face, sgn) move format that `pocket_cube.check` expects.
+"""
+
+from array import array
+from itertools import filterfalse, repeat
+from math import factorial
+from operator import add, floordiv, mod
+from typing import Optional
+from pocket_cube import SOLVED, rotate
+from pocket_cube_stats import SearchStats, dict_bytes
+
+# Moves in the order `pocket_cube.neighbors` generates them.
+# The inverse of move m is move m ^ 1.
+MOVES = ((0, -1), (0, 1), (1, -1), (1, 1), (2, -1), (2, 1))
+N_MOVES = len(MOVES)
+# last move recorded for the root of a search
+NO_MOVE = 0x7F
+# flag set in the last move byte of visited codes
+VISITED = 0x80
+
+# Facelet indices of each corner position, listed clockwise starting with
+# the facelet on face 0 or the opposite face. The last corner is the one
+# no move touches.
+CORNERS = (
+    (3, 8, 7),
+    (2, 6, 5),
+    (0, 4, 11),
+    (1, 10, 9),
+    (21, 15, 16),
+    (20, 13, 14),
+    (22, 19, 12),
+    (23, 17, 18),
+)
+N_CORNERS = 7
+N_PERMS = factorial(N_CORNERS)
+# twist of the last movable corner is implied by the other six
+N_TWISTS = 3 ** (N_CORNERS - 1)
+N_STATES = N_PERMS * N_TWISTS
+
+# colors of each cubie, in the clockwise order of its solved position
+CUBIE_COLORS = tuple(tuple(SOLVED[f] for f in corner) for corner in CORNERS)
+CUBIE_OF_COLORS = {colors: c for c, colors in enumerate(CUBIE_COLORS)}
+
+
+def rank_perm(perm: list[int]) -> int:
+    # Lehmer rank of a permutation of range(len(perm))
+    r = 0
+    n = len(perm)
+    for i in range(n):
+        smaller = 0
+        for j in range(i + 1, n):
+            if perm[j] < perm[i]:
+                smaller += 1
+        r = r * (n - i) + smaller
+    return r
+
+
+def unrank_perm(r: int, n: int = N_CORNERS) -> list[int]:
+    digits = []
+    for radix in range(1, n + 1):
+        r, d = divmod(r, radix)
+        digits.append(d)
+    digits.reverse()
+    remaining = list(range(n))
+    return [remaining.pop(d) for d in digits]
+
+
+def rank_twist(twist: list[int]) -> int:
+    r = 0
+    for t in reversed(twist[: N_CORNERS - 1]):
+        r = r * 3 + t
+    return r
+
+
+def unrank_twist(r: int) -> list[int]:
+    twist = []
+    for _ in range(N_CORNERS - 1):
+        r, t = divmod(r, 3)
+        twist.append(t)
+    twist.append(-sum(twist) % 3)
+    return twist
+
+
+def corners_of(config: str) -> tuple[list[int], list[int]]:
+    # cubie and twist at each of the 8 corner positions of config
+    perm, twist = [], []
+    for corner in CORNERS:
+        colors = [config[f] for f in corner]
+        # the twist is the position of the face 0 / face 5 colored facelet
+        for t in range(3):
+            if colors[t] in "05":
+                break
+        else:
+            raise ValueError(f"Corner {colors} has no top or bottom facelet")
+        c = CUBIE_OF_COLORS.get(tuple(colors[t:] + colors[:t]))
+        if c is None:
+            raise ValueError(f"No cubie with colors {colors}")
+        perm.append(c)
+        twist.append(t)
+    return perm, twist
+
+
+def encode(config: str) -> int:
+    """
+    Encode a configuration string as an integer code in range(N_STATES).
+
+    Raises:
+        ValueError: If config is not reachable from SOLVED by rotating
+            faces 0, 1 and 2.
+    """
+    perm, twist = corners_of(config)
+    fixed_cubie, fixed_twist = perm.pop(), twist.pop()
+    if fixed_cubie != N_CORNERS or fixed_twist != 0:
+        raise ValueError("Corner untouched by the moves is out of place")
+    if sorted(perm) != list(range(N_CORNERS)) or sum(twist) % 3 != 0:
+        raise ValueError("Configuration is not reachable")
+    return rank_perm(perm) * N_TWISTS + rank_twist(twist)
+
+
+def decode(code: int) -> str:
+    """Decode an integer code produced by encode back into a configuration string."""
+    p, t = divmod(code, N_TWISTS)
+    perm = unrank_perm(p) + [N_CORNERS]
+    twist = unrank_twist(t) + [0]
+    config = [""] * 24
+    for corner, c, t in zip(CORNERS, perm, twist):
+        for j in range(3):
+            config[corner[(j + t) % 3]] = CUBIE_COLORS[c][j]
+    return "".join(config)
+
+
+def build_move_tables() -> tuple[list[int], list[int]]:
+    # A move takes the cubie at position move_perm[p] to position p and adds
+    # move_twist[p] to its twist, as read off from rotating SOLVED. Since the
+    # permutation and the twists change independently, a table for each
+    # gives the move on codes.
+    perm_moves = [0] * (N_PERMS * N_MOVES)
+    twist_moves = [0] * (N_TWISTS * N_MOVES)
+    for m, (face, sgn) in enumerate(MOVES):
+        move_perm, move_twist = corners_of(rotate(SOLVED, face, sgn))
+        for p in range(N_PERMS):
+            perm = unrank_perm(p)
+            moved = [perm[move_perm[i]] for i in range(N_CORNERS)]
+            perm_moves[p * N_MOVES + m] = rank_perm(moved)
+        for t in range(N_TWISTS):
+            twist = unrank_twist(t)
+            moved = [(twist[move_perm[i]] + move_twist[i]) % 3 for i in range(N_CORNERS)]
+            twist_moves[t * N_MOVES + m] = rank_twist(moved)
+    return perm_moves, twist_moves
+
+
+PERM_MOVES, TWIST_MOVES = build_move_tables()
+SOLVED_CODE = encode(SOLVED)
+# one column of each table per move, with the permutation already scaled,
+# so the code reached by move m is PERM_COLUMNS[m][p] + TWIST_COLUMNS[m][t]
+PERM_COLUMNS = [PERM_MOVES[m::N_MOVES] for m in range(N_MOVES)]
+PERM_COLUMNS = [[p * N_TWISTS for p in column] for column in PERM_COLUMNS]
+TWIST_COLUMNS = [TWIST_MOVES[m::N_MOVES] for m in range(N_MOVES)]
+
+
+def apply_move(code: int, m: int) -> int:
+    # code of the state reached by applying MOVES[m] to code
+    p, t = divmod(code, N_TWISTS)
+    return PERM_MOVES[p * N_MOVES + m] * N_TWISTS + TWIST_MOVES[t * N_MOVES + m]
+
+
+def neighbors(code: int) -> list[int]:
+    p, t = divmod(code, N_TWISTS)
+    p, t = p * N_MOVES, t * N_MOVES
+    return [
+        PERM_MOVES[p + m] * N_TWISTS + TWIST_MOVES[t + m] for m in range(N_MOVES)
+    ]
+
+
+class CompactParents:
+    """
+    Parent pointers of a BFS tree over codes, in one byte per state.
+
+    Instead of the parent itself, each visited code stores the move that
+    reached it, since the parent is recovered by undoing that move. The
+    top bit of the byte marks the code as visited, so the bytes double as
+    the visited bitmap. Acts like a dict mapping each visited code to its
+    last move, NO_MOVE for the root.
+
+    Allocating the N_STATES bytes takes milliseconds, so this only pays off
+    for searches that visit a large part of the state space, like
+    basic_solve; the bidirectional solve keeps its parents in dicts.
+    """
+
+    __slots__ = ("moves", "size")
+
+    def __init__(self, root: int):
+        self.moves = bytearray(N_STATES)
+        self.size = 0
+        self[root] = NO_MOVE
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __contains__(self, code: int) -> bool:
+        return bool(self.moves[code])
+
+    def __getitem__(self, code: int) -> int:
+        if not self.moves[code]:
+            raise KeyError(code)
+        return self.moves[code] & ~VISITED
+
+    def __setitem__(self, code: int, m: int) -> None:
+        if not self.moves[code]:
+            self.size += 1
+        self.moves[code] = VISITED | m
+
+
+def explore_frontier(frontier: list[int], parent: dict[int, int]) -> list[int]:
+    # Explore frontier, recording for each new code the move that reached it;
+    # parent may also be a CompactParents
+    new_frontier = []
+    for f in frontier:
+        p, t = divmod(f, N_TWISTS)
+        p, t = p * N_MOVES, t * N_MOVES
+        for m in range(N_MOVES):
+            code = PERM_MOVES[p + m] * N_TWISTS + TWIST_MOVES[t + m]
+            if code not in parent:
+                parent[code] = m
+                new_frontier.append(code)
+    return new_frontier
+
+
+def moves_to_code(code: int, parent: dict[int, int]) -> list[int]:
+    # Return the moves leading from the root of parent to code, undoing
+    # the last move of each code in turn
+    moves = []
+    m = parent[code]
+    while m != NO_MOVE:
+        moves.append(m)
+        code = apply_move(code, m ^ 1)
+        m = parent[code]
+    moves.reverse()
+    return moves
+
+
+def explore_level(
+    frontier: array,
+    levels: Optional[bytearray],
+    level: int,
+    parent: Optional[CompactParents] = None,
+) -> array:
+    """
+    Explore a whole BFS frontier at once.
+
+    The neighbors of every code in frontier are gathered one move at a
+    time through the table columns and filtered against the visited codes
+    by C-level iteration, so only the new codes are visited one by one.
+    Memory is one byte per state plus the frontiers, as 4 byte ints.
+
+    Args:
+        frontier (array): Codes of the current level.
+        levels (bytearray): 1 + the level of every visited code, 0 for
+            codes not visited yet; new codes are marked with level.
+            Unused if parent is given.
+        level (int): 1 + the level of the codes to discover.
+        parent (CompactParents, optional): If given, the move that first
+            reached each new code is recorded in it, and its bytes tell the
+            visited codes instead of levels.
+
+    Returns:
+        array: The codes first reached from frontier.
+    """
+    perms = array("H", map(floordiv, frontier, repeat(N_TWISTS)))
+    twists = array("H", map(mod, frontier, repeat(N_TWISTS)))
+    visited = levels if parent is None else parent.moves
+    new_frontier = array("i")
+    for m, (perm_column, twist_column) in enumerate(zip(PERM_COLUMNS, TWIST_COLUMNS)):
+        reached = map(
+            add, map(perm_column.__getitem__, perms), map(twist_column.__getitem__, twists)
+        )
+        mark = level if parent is None else VISITED | m
+        # a code may be reached several times within the level
+        for code in filterfalse(visited.__getitem__, reached):
+            if not visited[code]:
+                visited[code] = mark
+                new_frontier.append(code)
+    if parent is not None:
+        parent.size += len(new_frontier)
+    return new_frontier
+
+
+def explore_all(
+    start: int,
+    parent: Optional[CompactParents] = None,
+    stats: Optional[SearchStats] = None,
+) -> tuple[Optional[bytearray], list[int]]:
+    """
+    Run a BFS from start over the whole state space, level by level,
+    recording the last move of each code in parent and each level in
+    stats if given.
+
+    Returns:
+        tuple: The levels bytearray of explore_level, one byte per state,
+            or None if parent is given, since parent then marks the visited
+            codes; and the number of codes at each distance from start.
+    """
+    levels = None
+    if parent is None:
+        levels = bytearray(N_STATES)
+        levels[start] = 1
+    frontier, sizes = array("i", [start]), []
+    while frontier:
+        sizes.append(len(frontier))
+        if stats is None:
+            frontier = explore_level(frontier, levels, len(sizes) + 1, parent)
+            continue
+        started = stats.clock()
+        new_frontier = explore_level(frontier, levels, len(sizes) + 1, parent)
+        stats.record_level(
+            "forward",
+            len(sizes),
+            len(frontier),
+            N_MOVES * len(frontier),
+            len(new_frontier),
+            started,
+        )
+        frontier = new_frontier
+    return levels, sizes
+
+
+def basic_solve(
+    config: str, stats: Optional[SearchStats] = None
+) -> Optional[list[tuple[int, int]]]:
+    """
+    Solve the given configuration by fully exploring the states reachable
+    from it, like `pocket_cube.basic_solve` but over codes.
+
+    Args:
+        config (str): The initial configuration to solve.
+        stats (SearchStats, optional): Filled in with statistics of the search.
+
+    Returns:
+        list or None: A shortest sequence of moves to solve the configuration,
+            or None if it's unsolvable.
+    """
+    try:
+        start = encode(config)
+    except ValueError:
+        return None
+    if stats is not None:
+        search_started = stats.start("coords.basic_solve")
+    parent = CompactParents(start)
+    explore_all(start, parent, stats)
+    if stats is not None:
+        stats.finish(search_started, len(parent), len(parent.moves))
+    if SOLVED_CODE not in parent:
+        return None
+    return [MOVES[m] for m in moves_to_code(SOLVED_CODE, parent)]
+
+
+def solve(
+    config: str, stats: Optional[SearchStats] = None
+) -> Optional[list[tuple[int, int]]]:
+    """
+    Solve the given configuration using a bidirectional BFS over codes.
+
+    Args:
+        config (str): The initial configuration to solve.
+        stats (SearchStats, optional): Filled in with statistics of the search.
+
+    Returns:
+        list or None: A sequence of moves to solve the configuration,
+            or None if it's unsolvable.
+    """
+    try:
+        start = encode(config)
+    except ValueError:
+        return None
+    if stats is not None:
+        search_started = stats.start("coords.solve")
+    # a shallow search visits few codes, so dicts beat CompactParents here
+    forward, backward = {start: NO_MOVE}, {SOLVED_CODE: NO_MOVE}
+    forward_frontier, backward_frontier = [start], [SOLVED_CODE]
+    depths = {"forward": 0, "backward": 0}
+    meet = start if start == SOLVED_CODE else None
+    while meet is None and forward_frontier and backward_frontier:
+        level_started = stats.clock() if stats is not None else 0.0
+        # grow the smaller side by one level
+        if len(forward_frontier) <= len(backward_frontier):
+            direction, frontier = "forward", forward_frontier
+            forward_frontier = explore_frontier(forward_frontier, forward)
+            new, other = forward_frontier, backward
+        else:
+            direction, frontier = "backward", backward_frontier
+            backward_frontier = explore_frontier(backward_frontier, backward)
+            new, other = backward_frontier, forward
+        meet = next(filter(other.__contains__, new), None)
+        depths[direction] += 1
+        if stats is not None:
+            stats.record_level(
+                direction,
+                depths[direction],
+                len(frontier),
+                N_MOVES * len(frontier),
+                len(new),
+                level_started,
+            )
+    if stats is not None:
+        stats.finish(
+            search_started,
+            len(forward) + len(backward),
+            dict_bytes(forward) + dict_bytes(backward),
+        )
+    if meet is None:
+        return None
+    moves = moves_to_code(meet, forward)
+    backward_moves = moves_to_code(meet, backward)
+    if stats is not None:
+        stats.meet_depth = (len(moves), len(backward_moves))
+    # walk back from the meeting state to SOLVED undoing the backward moves
+    moves.extend(m ^ 1 for m in reversed(backward_moves))
+    return [MOVES[m] for m in moves]
+
+
+if __name__ == "__main__":
+    from pocket_cube import scramble, check
+
+    scrambled_config = scramble(SOLVED, 100)
+    moves = solve(scrambled_config)
+    print(f"Solved in {len(moves)} moves: {check(scrambled_config, moves)}")
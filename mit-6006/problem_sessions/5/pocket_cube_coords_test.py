@@ -0,0 +1,89 @@
+"""
+Tests for pocket_cube_coords.py
+"""
+
+import random
+import unittest
+import pocket_cube_coords as coords
+from pocket_cube import SOLVED, check, rotate, scramble
+
+
+def random_config(rng: random.Random, n: int = 30) -> str:
+    config = SOLVED
+    for _ in range(n):
+        config = rotate(config, *rng.choice(coords.MOVES))
+    return config
+
+
+class TestPocketCubeCoords(unittest.TestCase):
+
+    def test_encode_decode_round_trip(self):
+        rng = random.Random(6006)
+        self.assertEqual(coords.decode(coords.SOLVED_CODE), SOLVED)
+        for _ in range(200):
+            code = rng.randrange(coords.N_STATES)
+            self.assertEqual(coords.encode(coords.decode(code)), code)
+
+    def test_moves_match_rotate(self):
+        rng = random.Random(1)
+        for _ in range(100):
+            config = random_config(rng)
+            code = coords.encode(config)
+            for m, (face, sgn) in enumerate(coords.MOVES):
+                self.assertEqual(
+                    coords.decode(coords.apply_move(code, m)), rotate(config, face, sgn)
+                )
+
+    def test_unreachable_configs(self):
+        # swapping two facelets of a corner twists it in place
+        twisted = list(SOLVED)
+        twisted[3], twisted[8] = twisted[8], twisted[3]
+        with self.assertRaises(ValueError):
+            coords.encode("".join(twisted))
+        self.assertIsNone(coords.solve("".join(twisted)))
+
+    def test_solve(self):
+        rng = random.Random(2)
+        self.assertEqual(coords.solve(SOLVED), [])
+        for _ in range(20):
+            config = random_config(rng)
+            self.assertTrue(check(config, coords.solve(config)))
+        config = scramble(SOLVED, 100)
+        self.assertTrue(check(config, coords.solve(config)))
+
+    def test_explore_all(self):
+        levels, sizes = coords.explore_all(coords.SOLVED_CODE)
+        # known number of states at each quarter turn distance from SOLVED
+        self.assertEqual(
+            sizes,
+            [1, 6, 27, 120, 534, 2256, 8969, 33058, 114149, 360508, 930588,
+             1350852, 782536, 90280, 276],
+        )
+        self.assertNotIn(0, levels)
+
+    def test_compact_parents(self):
+        parent = coords.CompactParents(coords.SOLVED_CODE)
+        frontier = [coords.SOLVED_CODE]
+        for _ in range(4):
+            frontier = coords.explore_frontier(frontier, parent)
+        self.assertEqual(len(parent), 1 + 6 + 27 + 120 + 534)
+        self.assertEqual(parent[coords.SOLVED_CODE], coords.NO_MOVE)
+        for code in frontier:
+            moves = coords.moves_to_code(code, parent)
+            self.assertEqual(len(moves), 4)
+            for m in reversed(moves):
+                code = coords.apply_move(code, m ^ 1)
+            self.assertEqual(code, coords.SOLVED_CODE)
+        unvisited = next(c for c in range(coords.N_STATES) if c not in parent)
+        with self.assertRaises(KeyError):
+            parent[unvisited]
+
+    def test_basic_solve(self):
+        config = scramble(SOLVED, 100)
+        moves = coords.basic_solve(config)
+        self.assertTrue(check(config, moves))
+        self.assertEqual(len(moves), len(coords.solve(config)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,172 @@
+"""
+This module solves Pocket Cube configurations with a precomputed distance table.
+
+A full BFS from the solved state records the distance of every one of the
+N_STATES reachable states in 4 bits, indexed by the integer code of
+`pocket_cube_coords`, which is less than 2 MB in total. The table is stored
+on disk once and memory-mapped afterwards. Solving a configuration is then
+a greedy walk: from each state, some move leads to a state one step closer
+to SOLVED, so a shortest solution takes O(depth) table lookups.
+"""
+
+import mmap
+import os
+from functools import lru_cache
+from typing import Optional, Union
+from pocket_cube_coords import (
+    MOVES,
+    N_MOVES,
+    N_STATES,
+    N_TWISTS,
+    PERM_MOVES,
+    SOLVED_CODE,
+    TWIST_MOVES,
+    apply_move,
+    encode,
+)
+from pocket_cube_stats import SearchStats
+
+DEFAULT_PATH = os.path.join(os.path.dirname(__file__), "pocket_cube_distances.bin")
+# distance stored for states not reached (yet)
+UNREACHED = 0xF
+
+DistanceTable = Union[bytearray, mmap.mmap]
+
+
+def get_distance(table: DistanceTable, code: int) -> int:
+    return (table[code >> 1] >> ((code & 1) << 2)) & 0xF
+
+
+def set_distance(table: bytearray, code: int, distance: int) -> None:
+    i, shift = code >> 1, (code & 1) << 2
+    table[i] = table[i] & (0xF0 >> shift) | (distance << shift)
+
+
+def generate_distance_table(symmetric: bool = False) -> bytearray:
+    """
+    Compute the distance from SOLVED of every state with a BFS.
+
+    Args:
+        symmetric (bool): Explore one canonical state per class of
+            symmetric states and fill in the rest of the class from it.
+
+    Returns:
+        bytearray: Two 4 bit distances per byte, the low nibble for even codes.
+    """
+    table = bytearray([0xFF]) * ((N_STATES + 1) // 2)
+    set_distance(table, SOLVED_CODE, 0)
+    if symmetric:
+        return generate_symmetric_distances(table)
+    frontier, depth = [SOLVED_CODE], 0
+    while frontier:
+        depth += 1
+        new_frontier = []
+        for f in frontier:
+            p, t = divmod(f, N_TWISTS)
+            p, t = p * N_MOVES, t * N_MOVES
+            for m in range(N_MOVES):
+                code = PERM_MOVES[p + m] * N_TWISTS + TWIST_MOVES[t + m]
+                i, shift = code >> 1, (code & 1) << 2
+                if (table[i] >> shift) & 0xF == UNREACHED:
+                    table[i] = table[i] & (0xF0 >> shift) | (depth << shift)
+                    new_frontier.append(code)
+        frontier = new_frontier
+    return table
+
+
+def generate_symmetric_distances(table: bytearray) -> bytearray:
+    # BFS over canonical codes; SOLVED is the only state of its class.
+    # Imported here, as building the symmetry tables takes seconds.
+    from pocket_cube_symmetry import canonical, symmetric_codes
+
+    frontier, depth = [SOLVED_CODE], 0
+    while frontier:
+        depth += 1
+        new_frontier = []
+        for f in frontier:
+            for m in range(N_MOVES):
+                rep = canonical(apply_move(f, m))
+                if get_distance(table, rep) == UNREACHED:
+                    for code in symmetric_codes(rep):
+                        set_distance(table, code, depth)
+                    new_frontier.append(rep)
+        frontier = new_frontier
+    return table
+
+
+def save_distance_table(table: DistanceTable, path: str = DEFAULT_PATH) -> None:
+    with open(path, "wb") as f:
+        f.write(table)
+
+
+@lru_cache(maxsize=None)
+def load_distance_table(path: str = DEFAULT_PATH) -> mmap.mmap:
+    """
+    Memory-map the distance table stored at path, generating it first
+    if the file does not exist yet. The mapping is cached per path, so
+    repeated loads, and processes forked after the first load, share it.
+
+    Returns:
+        mmap.mmap: The read-only distance table.
+    """
+    if not os.path.exists(path):
+        save_distance_table(generate_distance_table(), path)
+    with open(path, "rb") as f:
+        table = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    if len(table) != (N_STATES + 1) // 2:
+        raise ValueError(f"{path} is not a pocket cube distance table")
+    return table
+
+
+def solve(
+    config: str,
+    table: Optional[DistanceTable] = None,
+    stats: Optional[SearchStats] = None,
+) -> Optional[list[tuple[int, int]]]:
+    """
+    Solve the given configuration by walking downhill in the distance table.
+
+    Args:
+        config (str): The initial configuration to solve.
+        table: The distance table, by default loaded from DEFAULT_PATH.
+        stats (SearchStats, optional): Filled in with statistics of the walk,
+            one level per step.
+
+    Returns:
+        list or None: A shortest sequence of moves to solve the configuration,
+            or None if it's unsolvable.
+    """
+    if table is None:
+        table = load_distance_table()
+    try:
+        code = encode(config)
+    except ValueError:
+        return None
+    if stats is not None:
+        search_started = stats.start("table")
+    depth = get_distance(table, code)
+    if depth == UNREACHED:
+        return None
+    moves = []
+    while depth > 0:
+        level_started = stats.clock() if stats is not None else 0.0
+        for m in range(N_MOVES):
+            n = apply_move(code, m)
+            if get_distance(table, n) == depth - 1:
+                break
+        moves.append(MOVES[m])
+        code, depth = n, depth - 1
+        if stats is not None:
+            stats.record_level("forward", len(moves), 1, m + 1, 1, level_started)
+    if stats is not None:
+        stats.finish(search_started, len(moves) + 1, len(table))
+    return moves
+
+
+if __name__ == "__main__":
+    from pocket_cube import SOLVED, check, scramble
+
+    distances = load_distance_table()
+    scrambled_config = scramble(SOLVED, 100)
+    moves = solve(scrambled_config, distances)
+    print(f"Solved in {len(moves)} moves: {check(scrambled_config, moves)}")
@@ -0,0 +1,83 @@
+"""
+Tests for pocket_cube_db.py
+"""
+
+import os
+import random
+import tempfile
+import unittest
+from collections import Counter
+from functools import lru_cache
+import pocket_cube_coords as coords
+import pocket_cube_db as db
+from pocket_cube import SOLVED, check
+
+# known number of states at each quarter turn distance from SOLVED
+LEVEL_SIZES = [1, 6, 27, 120, 534, 2256, 8969, 33058, 114149, 360508, 930588,
+               1350852, 782536, 90280, 276]
+
+
+@lru_cache(maxsize=None)
+def distance_table() -> bytes:
+    # generated once per test run, for every test that needs a table
+    return bytes(db.generate_distance_table())
+
+
+def level_sizes(table) -> list[int]:
+    # number of codes at each distance, counting the two nibbles of each byte
+    counts = Counter()
+    for byte, n in Counter(table).items():
+        counts[byte & 0xF] += n
+        counts[byte >> 4] += n
+    return [counts[d] for d in range(max(counts) + 1)]
+
+
+class TestPocketCubeDB(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.directory = tempfile.TemporaryDirectory()
+        cls.path = os.path.join(cls.directory.name, "distances.bin")
+        db.save_distance_table(distance_table(), cls.path)
+
+    @classmethod
+    def tearDownClass(cls):
+        db.load_distance_table.cache_clear()
+        cls.directory.cleanup()
+
+    def test_level_sizes(self):
+        table = distance_table()
+        self.assertEqual(len(table), (coords.N_STATES + 1) // 2)
+        self.assertEqual(level_sizes(table), LEVEL_SIZES)
+        self.assertEqual(db.get_distance(table, coords.SOLVED_CODE), 0)
+
+    def test_save_and_load(self):
+        table = db.load_distance_table(self.path)
+        self.assertEqual(table[:], distance_table())
+        self.assertIs(db.load_distance_table(self.path), table)
+        truncated = os.path.join(self.directory.name, "truncated.bin")
+        db.save_distance_table(distance_table()[:-1], truncated)
+        with self.assertRaises(ValueError):
+            db.load_distance_table(truncated)
+
+    def test_symmetric_table(self):
+        self.assertEqual(db.generate_distance_table(symmetric=True), distance_table())
+
+    def test_solve_is_shortest(self):
+        table = distance_table()
+        rng = random.Random(6006)
+        self.assertEqual(db.solve(SOLVED, table), [])
+        for _ in range(20):
+            code = rng.randrange(coords.N_STATES)
+            config = coords.decode(code)
+            moves = db.solve(config, table)
+            self.assertTrue(check(config, moves))
+            self.assertEqual(len(moves), db.get_distance(table, code))
+            self.assertEqual(len(moves), len(coords.solve(config)))
+        twisted = list(SOLVED)
+        twisted[3], twisted[8] = twisted[8], twisted[3]
+        self.assertIsNone(db.solve("".join(twisted), table))
+
+
+if __name__ == "__main__":
+    unittest.main()
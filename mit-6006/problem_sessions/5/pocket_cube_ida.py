@@ -0,0 +1,148 @@
+"""
+This module solves Pocket Cube configurations with IDA* over integer codes.
+
+The code of a state from `pocket_cube_coords` is a corner permutation rank
+and a corner twist rank, and each move acts on the two independently. The
+number of moves needed to solve only the permutation, or only the twist, is
+therefore a lower bound on the number of moves needed to solve the state.
+Both are tabulated by a BFS over the 5040 permutations and the 729 twists,
+and their maximum is the admissible heuristic of an iterative deepening A*
+search. The search runs depth-first, so memory stays flat at the depth of
+the current path, however many states it expands.
+"""
+
+import sys
+from typing import Optional
+from pocket_cube_coords import (
+    MOVES,
+    N_MOVES,
+    N_PERMS,
+    N_TWISTS,
+    PERM_MOVES,
+    SOLVED_CODE,
+    TWIST_MOVES,
+    encode,
+)
+from pocket_cube_stats import SearchStats
+
+SOLVED_PERM, SOLVED_TWIST = divmod(SOLVED_CODE, N_TWISTS)
+
+
+def build_pruning_table(moves: list[int], size: int, solved: int) -> bytearray:
+    # distance from solved of each coordinate, by BFS over the move table
+    distances = bytearray([0xFF]) * size
+    distances[solved] = 0
+    frontier, depth = [solved], 0
+    while frontier:
+        depth += 1
+        new_frontier = []
+        for f in frontier:
+            for m in range(N_MOVES):
+                x = moves[f * N_MOVES + m]
+                if distances[x] == 0xFF:
+                    distances[x] = depth
+                    new_frontier.append(x)
+        frontier = new_frontier
+    return distances
+
+
+PERM_DISTANCES = build_pruning_table(PERM_MOVES, N_PERMS, SOLVED_PERM)
+TWIST_DISTANCES = build_pruning_table(TWIST_MOVES, N_TWISTS, SOLVED_TWIST)
+
+
+def heuristic(code: int) -> int:
+    # lower bound on the number of moves from code to SOLVED
+    p, t = divmod(code, N_TWISTS)
+    return max(PERM_DISTANCES[p], TWIST_DISTANCES[t])
+
+
+def search(
+    p: int, t: int, depth: int, last: int, path: list[int], counts: list[int]
+) -> int:
+    """
+    Depth-first search below the state with permutation p and twist t,
+    at most depth more moves, appending the moves of a solution to path.
+    Adds the number of states expanded and generated to counts.
+
+    Returns:
+        int: -1 if a solution was found, else the smallest number of moves
+            past depth that a solution through an explored state could need.
+    """
+    h = max(PERM_DISTANCES[p], TWIST_DISTANCES[t])
+    if h > depth:
+        return h - depth
+    # a state is solved exactly when both of its coordinates are
+    if h == 0:
+        return -1
+    excess = 0xFF
+    counts[0] += 1
+    for m in range(N_MOVES):
+        # skip sequences that an equal or shorter one already covers: undoing
+        # the previous move, two counterclockwise quarter turns of a face
+        # (the same as two clockwise ones) and three turns the same way
+        if m == last ^ 1 or m == last and (m & 1 == 0 or path[-2:-1] == [m]):
+            continue
+        counts[1] += 1
+        path.append(m)
+        found = search(
+            PERM_MOVES[p * N_MOVES + m],
+            TWIST_MOVES[t * N_MOVES + m],
+            depth - 1,
+            m,
+            path,
+            counts,
+        )
+        if found < 0:
+            return found
+        path.pop()
+        excess = min(excess, found)
+    return excess
+
+
+def solve(
+    config: str, stats: Optional[SearchStats] = None
+) -> Optional[list[tuple[int, int]]]:
+    """
+    Solve the given configuration using IDA* with pruning tables.
+
+    Args:
+        config (str): The initial configuration to solve.
+        stats (SearchStats, optional): Filled in with statistics of the search,
+            one level per deepening iteration. States are not deduplicated,
+            so every state generated counts as new.
+
+    Returns:
+        list or None: A shortest sequence of moves to solve the configuration,
+            or None if it's unsolvable.
+    """
+    try:
+        code = encode(config)
+    except ValueError:
+        return None
+    if stats is not None:
+        search_started = stats.start("ida*")
+    p, t = divmod(code, N_TWISTS)
+    depth, path, visited = heuristic(code), [], 1
+    # every reachable state is solved by some sequence of moves, so deepening
+    # until the search succeeds terminates
+    while True:
+        counts = [0, 0]
+        level_started = stats.clock() if stats is not None else 0.0
+        excess = search(p, t, depth, N_MOVES, path, counts)
+        if stats is not None:
+            stats.record_level("forward", depth, counts[0], counts[1], counts[1], level_started)
+            visited += counts[1]
+        if excess < 0:
+            break
+        depth += excess
+    if stats is not None:
+        stats.finish(search_started, visited, sys.getsizeof(path))
+    return [MOVES[m] for m in path]
+
+
+if __name__ == "__main__":
+    from pocket_cube import SOLVED, check, scramble
+
+    scrambled_config = scramble(SOLVED, 100)
+    moves = solve(scrambled_config)
+    print(f"Solved in {len(moves)} moves: {check(scrambled_config, moves)}")
@@ -0,0 +1,44 @@
+"""
+Tests for pocket_cube_ida.py
+"""
+
+import random
+import unittest
+import pocket_cube
+import pocket_cube_coords as coords
+import pocket_cube_db as db
+import pocket_cube_ida as ida
+from pocket_cube import SOLVED, check
+from pocket_cube_db_test import distance_table
+
+
+class TestPocketCubeIDA(unittest.TestCase):
+
+    def test_heuristic_is_admissible(self):
+        table = distance_table()
+        rng = random.Random(6006)
+        for _ in range(1000):
+            code = rng.randrange(coords.N_STATES)
+            self.assertLessEqual(ida.heuristic(code), db.get_distance(table, code))
+
+    def test_solve_is_optimal(self):
+        rng = random.Random(1)
+        self.assertEqual(ida.solve(SOLVED), [])
+        for _ in range(20):
+            config = coords.decode(rng.randrange(coords.N_STATES))
+            moves = ida.solve(config)
+            self.assertTrue(check(config, moves))
+            self.assertEqual(len(moves), len(coords.solve(config)))
+
+    def test_solve_strategy(self):
+        config = coords.decode(12345)
+        self.assertEqual(pocket_cube.solve(config, strategy="ida*"), ida.solve(config))
+        twisted = list(SOLVED)
+        twisted[3], twisted[8] = twisted[8], twisted[3]
+        self.assertIsNone(pocket_cube.solve("".join(twisted), strategy="ida*"))
+        with self.assertRaises(ValueError):
+            pocket_cube.solve(config, strategy="dfs")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,128 @@
+"""
+This module records statistics of Pocket Cube searches.
+
+Every solver takes an optional `stats` argument. When a SearchStats is
+passed, the solver fills it in as it goes: one LevelStats per frontier it
+explores (or per deepening iteration for IDA*), the number of states it
+visited, the memory used by its visited set and parent pointers, and where
+a bidirectional search met. The `on_level` callback, if set, is called
+with each LevelStats as soon as it is recorded, so search behavior can be
+logged or plotted while a long search is still running.
+"""
+
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+
+
+@dataclass
+class LevelStats:
+    """
+    Statistics of exploring one frontier.
+
+    Attributes:
+        direction (str): "forward" from the query, "backward" from SOLVED.
+        depth (int): Distance from the root of the states discovered.
+        expanded (int): Number of states in the frontier explored.
+        generated (int): Number of neighbors generated from them.
+        new (int): Number of neighbors not visited before.
+        seconds (float): Time spent exploring the frontier.
+    """
+
+    direction: str
+    depth: int
+    expanded: int
+    generated: int
+    new: int
+    seconds: float
+
+    @property
+    def duplicates(self) -> int:
+        return self.generated - self.new
+
+    @property
+    def dedup_rate(self) -> float:
+        # fraction of generated neighbors that were already visited
+        return self.duplicates / self.generated if self.generated else 0.0
+
+
+@dataclass
+class SearchStats:
+    """
+    Statistics of a whole search.
+
+    Attributes:
+        solver (str): Name of the solver that filled these in.
+        levels (list): LevelStats of each frontier, in the order explored.
+        visited (int): Number of states visited.
+        bytes (int): Approximate memory used by the visited states
+            and parent pointers.
+        seconds (float): Total time of the search.
+        meet_depth (tuple, optional): Depth of the meeting state from the
+            query and from SOLVED, for bidirectional searches that met.
+        on_level (callable, optional): Called with each LevelStats recorded.
+    """
+
+    solver: str = ""
+    levels: list[LevelStats] = field(default_factory=list)
+    visited: int = 0
+    bytes: int = 0
+    seconds: float = 0.0
+    meet_depth: Optional[tuple[int, int]] = None
+    on_level: Optional[Callable[[LevelStats], None]] = field(default=None, repr=False)
+
+    @staticmethod
+    def clock() -> float:
+        return time.perf_counter()
+
+    def start(self, solver: str) -> float:
+        # reset for a new search by solver, returning its start time
+        self.solver = solver
+        self.levels = []
+        self.visited = self.bytes = 0
+        self.seconds = 0.0
+        self.meet_depth = None
+        return self.clock()
+
+    def finish(self, started: float, visited: int, n_bytes: int) -> None:
+        self.seconds = self.clock() - started
+        self.visited = visited
+        self.bytes = n_bytes
+
+    def record_level(
+        self,
+        direction: str,
+        depth: int,
+        expanded: int,
+        generated: int,
+        new: int,
+        started: float,
+    ) -> LevelStats:
+        # record a frontier explored since started, and report it
+        level = LevelStats(
+            direction, depth, expanded, generated, new, self.clock() - started
+        )
+        self.levels.append(level)
+        if self.on_level is not None:
+            self.on_level(level)
+        return level
+
+    @property
+    def expanded(self) -> int:
+        return sum(level.expanded for level in self.levels)
+
+    @property
+    def generated(self) -> int:
+        return sum(level.generated for level in self.levels)
+
+    @property
+    def dedup_rate(self) -> float:
+        generated = self.generated
+        duplicates = sum(level.duplicates for level in self.levels)
+        return duplicates / generated if generated else 0.0
+
+
+def dict_bytes(parent: dict) -> int:
+    # memory of a dict and its keys, the values being keys or small ints too
+    return sys.getsizeof(parent) + sum(sys.getsizeof(key) for key in parent)
@@ -0,0 +1,79 @@
+"""
+Tests for pocket_cube_stats.py
+"""
+
+import unittest
+import pocket_cube
+import pocket_cube_coords as coords
+import pocket_cube_db as db
+import pocket_cube_ida as ida
+import pocket_cube_symmetry as symmetry
+from pocket_cube import check
+from pocket_cube_db_test import distance_table
+from pocket_cube_stats import SearchStats
+
+# 12 quarter turns from SOLVED
+CONFIG = coords.decode(12345)
+
+
+class TestSearchStats(unittest.TestCase):
+
+    def check_stats(self, stats, solver, moves):
+        self.assertEqual(stats.solver, solver)
+        self.assertTrue(stats.levels)
+        self.assertGreater(stats.visited, 0)
+        self.assertGreater(stats.bytes, 0)
+        self.assertGreaterEqual(stats.seconds, sum(level.seconds for level in stats.levels))
+        self.assertGreaterEqual(stats.dedup_rate, 0.0)
+        self.assertLessEqual(stats.dedup_rate, 1.0)
+        if stats.meet_depth is not None:
+            self.assertEqual(sum(stats.meet_depth), len(moves))
+
+    def test_bidirectional_solvers(self):
+        for solve, solver in (
+            (pocket_cube.solve, "solve"),
+            (coords.solve, "coords.solve"),
+            (symmetry.solve, "symmetry.solve"),
+        ):
+            levels = []
+            stats = SearchStats(on_level=levels.append)
+            moves = solve(CONFIG, stats=stats)
+            self.assertTrue(check(CONFIG, moves))
+            self.check_stats(stats, solver, moves)
+            self.assertEqual(levels, stats.levels)
+            self.assertIsNotNone(stats.meet_depth)
+            for direction in ("forward", "backward"):
+                depths = [l.depth for l in stats.levels if l.direction == direction]
+                self.assertEqual(depths, list(range(1, len(depths) + 1)))
+
+    def test_coords_levels(self):
+        stats = SearchStats()
+        coords.solve(CONFIG, stats=stats)
+        # with no symmetry reduction, the first levels of each side are the
+        # number of states at each distance from any state
+        first = [l.new for l in stats.levels if l.direction == "backward"][:3]
+        self.assertEqual(first, [6, 27, 120])
+        for level in stats.levels:
+            self.assertEqual(level.generated, coords.N_MOVES * level.expanded)
+
+    def test_other_solvers(self):
+        stats = SearchStats()
+        moves = ida.solve(CONFIG, stats=stats)
+        self.check_stats(stats, "ida*", moves)
+        self.assertEqual(stats.levels[-1].depth, len(moves))
+        self.assertEqual(stats.dedup_rate, 0.0)
+        stats = SearchStats()
+        moves = db.solve(CONFIG, distance_table(), stats=stats)
+        self.check_stats(stats, "table", moves)
+        self.assertEqual(len(stats.levels), len(moves))
+
+    def test_stats_reset(self):
+        stats = SearchStats()
+        coords.solve(CONFIG, stats=stats)
+        coords.solve(coords.decode(coords.SOLVED_CODE), stats=stats)
+        self.assertEqual(stats.levels, [])
+        self.assertEqual(stats.meet_depth, (0, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
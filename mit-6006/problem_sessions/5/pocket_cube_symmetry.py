@@ -0,0 +1,341 @@
+"""
+This module reduces Pocket Cube searches by the symmetries of the cube.
+
+Whole-cube orientations are already factored out by `pocket_cube_coords`,
+which keeps the corner untouched by faces 0, 1 and 2 in place. What remains
+are the 6 symmetries of the cube that fix that corner: the 3 rotations
+about the diagonal through it and the 3 mirror images of those. Each maps
+the faces 0, 1 and 2 onto each other, so it maps every move onto a move,
+and states related by a symmetry are the same distance from SOLVED.
+
+A search can therefore visit one canonical representative per class of
+symmetric states, the smallest code in the class, exploring about 6 times
+fewer states. Paths are recovered by following the sequence of classes
+from the actual starting state.
+"""
+
+from array import array
+from itertools import permutations, product
+from typing import Optional
+from pocket_cube_coords import (
+    CORNERS,
+    MOVES,
+    N_MOVES,
+    N_PERMS,
+    N_TWISTS,
+    SOLVED_CODE,
+    apply_move,
+    decode,
+    encode,
+    neighbors,
+)
+from pocket_cube import SOLVED, rotate
+from pocket_cube_stats import SearchStats, dict_bytes
+
+# Cube geometry: corner cubies at (+-1, +-1, +-1), in the order of
+# pocket_cube_coords.CORNERS, and the facelets on the face with each normal.
+CORNER_CENTERS = (
+    (1, 1, 1),
+    (-1, 1, 1),
+    (-1, 1, -1),
+    (1, 1, -1),
+    (1, -1, 1),
+    (-1, -1, 1),
+    (-1, -1, -1),
+    (1, -1, -1),
+)
+FACES = {
+    (0, 1, 0): (0, 1, 2, 3),
+    (-1, 0, 0): (4, 5, 12, 13),
+    (0, 0, 1): (6, 7, 14, 15),
+    (1, 0, 0): (8, 9, 16, 17),
+    (0, 0, -1): (10, 11, 18, 19),
+    (0, -1, 0): (20, 21, 22, 23),
+}
+
+
+def facelet_geometry() -> list[tuple[tuple[int, ...], tuple[int, ...]]]:
+    # (corner center, face normal) of each facelet
+    face_of = {f: normal for normal, facelets in FACES.items() for f in facelets}
+    geometry = [None] * 24
+    for center, corner in zip(CORNER_CENTERS, CORNERS):
+        for f in corner:
+            geometry[f] = (center, face_of[f])
+    return geometry
+
+
+def cube_symmetries() -> list[tuple[tuple[int, ...], tuple[int, ...]]]:
+    # all 48 signed permutation matrices, as (axis order, axis signs)
+    return [
+        (axes, signs)
+        for axes in permutations(range(3))
+        for signs in product((1, -1), repeat=3)
+    ]
+
+
+def transform(matrix, v: tuple[int, ...]) -> tuple[int, ...]:
+    axes, signs = matrix
+    return tuple(s * v[a] for a, s in zip(axes, signs))
+
+
+def facelet_maps(matrix, recolor: bool) -> tuple[list[int], dict[str, str]]:
+    # where each facelet goes under matrix, and how colors change with it
+    geometry = facelet_geometry()
+    index = {g: f for f, g in enumerate(geometry)}
+    fmap = [index[(transform(matrix, c), transform(matrix, n))] for c, n in geometry]
+    cmap = {SOLVED[f]: SOLVED[f] for f in range(24)}
+    if recolor:
+        cmap = {SOLVED[f]: SOLVED[fmap[f]] for f in range(24)}
+    return fmap, cmap
+
+
+def apply_to_config(maps: tuple[list[int], dict[str, str]], config: str) -> str:
+    fmap, cmap = maps
+    new_config = [""] * 24
+    for f, color in enumerate(config):
+        new_config[fmap[f]] = cmap[color]
+    return "".join(new_config)
+
+
+def determinant(matrix) -> int:
+    axes, signs = matrix
+    inversions = sum(1 for i in range(3) for j in range(i) if axes[j] > axes[i])
+    return (-1) ** inversions * signs[0] * signs[1] * signs[2]
+
+
+FIXED_CORNER = CORNER_CENTERS[-1]
+# the 6 symmetries fixing the corner no move touches, identity first
+SYMMETRIES = [
+    facelet_maps(m, True)
+    for m in cube_symmetries()
+    if transform(m, FIXED_CORNER) == FIXED_CORNER
+]
+N_SYMS = len(SYMMETRIES)
+# the 24 whole-cube rotations, which move facelets without recoloring them
+ROTATIONS = [facelet_maps(m, False) for m in cube_symmetries() if determinant(m) == 1]
+
+
+def build_move_map() -> list[list[int]]:
+    # MOVE_MAP[s][m] is the move that conjugating MOVES[m] by symmetry s gives
+    probe = SOLVED
+    for m in (0, 2, 5, 3):
+        probe = rotate(probe, *MOVES[m])
+    move_map = []
+    for sym in SYMMETRIES:
+        image = apply_to_config(sym, probe)
+        row = []
+        for face, sgn in MOVES:
+            moved = apply_to_config(sym, rotate(probe, face, sgn))
+            row.append(next(n for n, mv in enumerate(MOVES) if rotate(image, *mv) == moved))
+        move_map.append(row)
+    return move_map
+
+
+def twist_digits(t: int) -> list[int]:
+    digits = []
+    for _ in range(6):
+        t, d = divmod(t, 3)
+        digits.append(d)
+    return digits
+
+
+def twist_of_digits(digits: list[int]) -> int:
+    t = 0
+    for d in reversed(digits):
+        t = t * 3 + d
+    return t
+
+
+def build_symmetry_tables() -> tuple[list[int], list[int], list[int], array]:
+    # Conjugating a state by a symmetry permutes and recolors its corners,
+    # so the new twist of a corner is its old twist (negated for mirror
+    # images) plus an offset that depends on the corner's position and on
+    # which cubie it is. The code of the image is therefore
+    #   PERM_SYM[p] * N_TWISTS + TWIST_ADD[TWIST_SYM[t], TWIST_OFFSET[p]]
+    # where TWIST_ADD adds twists corner by corner.
+    perm_sym = [0] * (N_PERMS * N_SYMS)
+    twist_offset = [0] * (N_PERMS * N_SYMS)
+    twist_sym = [0] * (N_TWISTS * N_SYMS)
+    for p in range(N_PERMS):
+        config = decode(p * N_TWISTS)
+        for s, sym in enumerate(SYMMETRIES):
+            perm_sym[p * N_SYMS + s], twist_offset[p * N_SYMS + s] = divmod(
+                encode(apply_to_config(sym, config)), N_TWISTS
+            )
+    for t in range(N_TWISTS):
+        config = decode(t)
+        for s, sym in enumerate(SYMMETRIES):
+            moved = twist_digits(encode(apply_to_config(sym, config)) % N_TWISTS)
+            offset = twist_digits(twist_offset[s])
+            twist_sym[t * N_SYMS + s] = twist_of_digits(
+                [(a - b) % 3 for a, b in zip(moved, offset)]
+            )
+    digits = [twist_digits(t) for t in range(N_TWISTS)]
+    twist_add = array(
+        "H",
+        (
+            twist_of_digits([(x + y) % 3 for x, y in zip(a, b)])
+            for a in digits
+            for b in digits
+        ),
+    )
+    return perm_sym, twist_offset, twist_sym, twist_add
+
+
+MOVE_MAP = build_move_map()
+PERM_SYM, TWIST_OFFSET, TWIST_SYM, TWIST_ADD = build_symmetry_tables()
+
+
+def apply_symmetry(code: int, s: int) -> int:
+    # code of the image of code under SYMMETRIES[s]
+    p, t = divmod(code, N_TWISTS)
+    i, j = p * N_SYMS + s, t * N_SYMS + s
+    return PERM_SYM[i] * N_TWISTS + TWIST_ADD[TWIST_SYM[j] * N_TWISTS + TWIST_OFFSET[i]]
+
+
+def canonical(code: int) -> int:
+    # smallest code among the symmetric images of code
+    p, t = divmod(code, N_TWISTS)
+    p, t = p * N_SYMS, t * N_SYMS
+    return min(
+        PERM_SYM[p + s] * N_TWISTS
+        + TWIST_ADD[TWIST_SYM[t + s] * N_TWISTS + TWIST_OFFSET[p + s]]
+        for s in range(N_SYMS)
+    )
+
+
+def symmetric_codes(code: int) -> set[int]:
+    return {apply_symmetry(code, s) for s in range(N_SYMS)}
+
+
+def orient(config: str) -> Optional[str]:
+    """
+    Turn the whole cube so that the corner untouched by the moves is in place.
+
+    Args:
+        config (str): A configuration in any of the 24 whole-cube orientations.
+
+    Returns:
+        str or None: The equivalent configuration pocket_cube_coords can
+            encode, or None if there is none.
+    """
+    for rotation in ROTATIONS:
+        turned = apply_to_config(rotation, config)
+        try:
+            encode(turned)
+        except ValueError:
+            continue
+        return turned
+    return None
+
+
+def explore_frontier(frontier: list[int], parent: dict[int, int]) -> list[int]:
+    # Explore frontier of canonical codes, adding new classes to parent
+    new_frontier = []
+    for f in frontier:
+        for code in neighbors(f):
+            rep = canonical(code)
+            if rep not in parent:
+                parent[rep] = f
+                new_frontier.append(rep)
+    return new_frontier
+
+
+def path_to_class(rep: int, parent: dict[int, Optional[int]]) -> list[int]:
+    # Return the classes from the root of parent to rep
+    path = [rep]
+    while parent[path[-1]] is not None:
+        path.append(parent[path[-1]])
+    path.reverse()
+    return path
+
+
+def moves_through_classes(code: int, classes: list[int]) -> list[int]:
+    # Moves from code through states of the given classes, in order
+    moves = []
+    for rep in classes:
+        for m in range(N_MOVES):
+            n = apply_move(code, m)
+            if canonical(n) == rep:
+                break
+        else:
+            raise ValueError(f"Class {rep} is not adjacent to state {code}")
+        moves.append(m)
+        code = n
+    return moves
+
+
+def solve(
+    config: str, stats: Optional[SearchStats] = None
+) -> Optional[list[tuple[int, int]]]:
+    """
+    Solve the given configuration using a bidirectional BFS over
+    classes of symmetric states.
+
+    Args:
+        config (str): The initial configuration to solve.
+        stats (SearchStats, optional): Filled in with statistics of the search,
+            counting classes rather than states.
+
+    Returns:
+        list or None: A sequence of moves to solve the configuration,
+            or None if it's unsolvable.
+    """
+    try:
+        start = encode(config)
+    except ValueError:
+        return None
+    if stats is not None:
+        search_started = stats.start("symmetry.solve")
+    root = canonical(start)
+    # SOLVED is its own class since every symmetry fixes it
+    forward, backward = {root: None}, {SOLVED_CODE: None}
+    forward_frontier, backward_frontier = [root], [SOLVED_CODE]
+    depths = {"forward": 0, "backward": 0}
+    meet = root if root == SOLVED_CODE else None
+    while meet is None and forward_frontier and backward_frontier:
+        level_started = stats.clock() if stats is not None else 0.0
+        if len(forward_frontier) <= len(backward_frontier):
+            direction, frontier = "forward", forward_frontier
+            forward_frontier = explore_frontier(forward_frontier, forward)
+            new, other = forward_frontier, backward
+        else:
+            direction, frontier = "backward", backward_frontier
+            backward_frontier = explore_frontier(backward_frontier, backward)
+            new, other = backward_frontier, forward
+        for rep in new:
+            if rep in other:
+                meet = rep
+                break
+        depths[direction] += 1
+        if stats is not None:
+            stats.record_level(
+                direction,
+                depths[direction],
+                len(frontier),
+                N_MOVES * len(frontier),
+                len(new),
+                level_started,
+            )
+    if stats is not None:
+        stats.finish(
+            search_started,
+            len(forward) + len(backward),
+            dict_bytes(forward) + dict_bytes(backward),
+        )
+    if meet is None:
+        return None
+    forward_classes = path_to_class(meet, forward)
+    backward_classes = path_to_class(meet, backward)
+    if stats is not None:
+        stats.meet_depth = (len(forward_classes) - 1, len(backward_classes) - 1)
+    classes = forward_classes[1:] + backward_classes[-2::-1]
+    return [MOVES[m] for m in moves_through_classes(start, classes)]
+
+
+if __name__ == "__main__":
+    from pocket_cube import check, scramble
+
+    scrambled_config = scramble(SOLVED, 100)
+    moves = solve(scrambled_config)
+    print(f"Solved in {len(moves)} moves: {check(scrambled_config, moves)}")
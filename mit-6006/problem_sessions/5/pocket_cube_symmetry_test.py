@@ -0,0 +1,64 @@
+"""
+Tests for pocket_cube_symmetry.py
+"""
+
+import random
+import unittest
+import pocket_cube_coords as coords
+import pocket_cube_symmetry as symmetry
+from pocket_cube import SOLVED, check
+
+
+class TestPocketCubeSymmetry(unittest.TestCase):
+
+    def test_symmetry_tables_match_configs(self):
+        rng = random.Random(6006)
+        for _ in range(100):
+            code = rng.randrange(coords.N_STATES)
+            config = coords.decode(code)
+            for s, sym in enumerate(symmetry.SYMMETRIES):
+                image = symmetry.apply_to_config(sym, config)
+                self.assertEqual(symmetry.apply_symmetry(code, s), coords.encode(image))
+
+    def test_symmetries_map_moves_to_moves(self):
+        rng = random.Random(1)
+        for _ in range(50):
+            code = rng.randrange(coords.N_STATES)
+            for s in range(symmetry.N_SYMS):
+                for m in range(coords.N_MOVES):
+                    self.assertEqual(
+                        symmetry.apply_symmetry(coords.apply_move(code, m), s),
+                        coords.apply_move(
+                            symmetry.apply_symmetry(code, s), symmetry.MOVE_MAP[s][m]
+                        ),
+                    )
+
+    def test_canonical_is_shared_by_class(self):
+        rng = random.Random(2)
+        self.assertEqual(symmetry.symmetric_codes(coords.SOLVED_CODE), {coords.SOLVED_CODE})
+        for _ in range(100):
+            code = rng.randrange(coords.N_STATES)
+            rep = symmetry.canonical(code)
+            self.assertEqual(rep, min(symmetry.symmetric_codes(code)))
+            for other in symmetry.symmetric_codes(code):
+                self.assertEqual(symmetry.canonical(other), rep)
+
+    def test_orient(self):
+        self.assertEqual(symmetry.orient(SOLVED), SOLVED)
+        config = coords.decode(12345)
+        for rotation in symmetry.ROTATIONS:
+            turned = symmetry.apply_to_config(rotation, config)
+            self.assertEqual(symmetry.orient(turned), config)
+
+    def test_solve(self):
+        rng = random.Random(3)
+        for _ in range(10):
+            config = coords.decode(rng.randrange(coords.N_STATES))
+            moves = symmetry.solve(config)
+            self.assertTrue(check(config, moves))
+            # no state is more than 14 quarter turns from SOLVED
+            self.assertLessEqual(len(moves), 14)
+
+
+if __name__ == "__main__":
+    unittest.main()
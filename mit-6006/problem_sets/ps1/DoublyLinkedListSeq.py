@@ -19,10 +19,11 @@ class DoublyLinkedListNode:
         self.next: Optional[DoublyLinkedListNode] = None
 
     def later_node(self, i):
-        if i == 0:
-            return self
-        assert self.next
-        return self.next.later_node(i - 1)
+        node = self
+        for _ in range(i):
+            assert node.next
+            node = node.next
+        return node
 
 
 class DoublyLinkedListSeq:
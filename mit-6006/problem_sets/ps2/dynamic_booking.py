@@ -0,0 +1,244 @@
+from typing import Iterator, Optional
+
+NEG_INF = float("-inf")
+
+
+class TimeNode:
+    """
+    A time at which talks start or end, in an AVL tree keyed by time.
+
+    Besides the number of talks starting and ending at its time, each node keeps
+    two aggregates of its subtree, in time order: the total change in booked rooms,
+    and the largest number of rooms booked right after one of its times, relative
+    to just before the subtree's first time.
+    """
+
+    __slots__ = ("time", "starts", "ends", "left", "right", "height", "total", "max_prefix")
+
+    def __init__(self, time: int):
+        self.time = time
+        self.starts = self.ends = 0
+        self.left: Optional["TimeNode"] = None
+        self.right: Optional["TimeNode"] = None
+        self.height = 0
+        self.total = 0
+        self.max_prefix = NEG_INF
+
+    @property
+    def delta(self) -> int:
+        return self.starts - self.ends
+
+    def update(self) -> None:
+        left_total, left_prefix, left_height = aggregates(self.left)
+        right_total, right_prefix, right_height = aggregates(self.right)
+        self.height = 1 + max(left_height, right_height)
+        self.total = left_total + self.delta + right_total
+        here = left_total + self.delta
+        self.max_prefix = max(left_prefix, here, here + right_prefix)
+
+
+def aggregates(node: Optional[TimeNode]) -> tuple[int, float, int]:
+    if node is None:
+        return 0, NEG_INF, -1
+    return node.total, node.max_prefix, node.height
+
+
+def height(node: Optional[TimeNode]) -> int:
+    return node.height if node is not None else -1
+
+
+def rotate_right(node: TimeNode) -> TimeNode:
+    top = node.left
+    node.left, top.right = top.right, node
+    node.update()
+    top.update()
+    return top
+
+
+def rotate_left(node: TimeNode) -> TimeNode:
+    top = node.right
+    node.right, top.left = top.left, node
+    node.update()
+    top.update()
+    return top
+
+
+def rebalance(node: TimeNode) -> TimeNode:
+    # restore the AVL property at node, whose subtrees are balanced
+    node.update()
+    skew = height(node.right) - height(node.left)
+    if skew > 1:
+        if height(node.right.left) > height(node.right.right):
+            node.right = rotate_right(node.right)
+        return rotate_left(node)
+    if skew < -1:
+        if height(node.left.right) > height(node.left.left):
+            node.left = rotate_left(node.left)
+        return rotate_right(node)
+    return node
+
+
+def pop_first(node: TimeNode) -> tuple[Optional[TimeNode], TimeNode]:
+    # remove the earliest node of the subtree, returning the new root and it
+    if node.left is None:
+        return node.right, node
+    node.left, first = pop_first(node.left)
+    return rebalance(node), first
+
+
+def adjust(
+    node: Optional[TimeNode], time: int, starts: int, ends: int
+) -> Optional[TimeNode]:
+    # add starts and ends to the counts at time, creating its node if needed
+    # and removing it once both counts are zero; returns the new subtree root
+    if node is None:
+        node = TimeNode(time)
+        node.starts, node.ends = starts, ends
+        node.update()
+        return node
+    if time < node.time:
+        node.left = adjust(node.left, time, starts, ends)
+    elif time > node.time:
+        node.right = adjust(node.right, time, starts, ends)
+    else:
+        node.starts += starts
+        node.ends += ends
+        if node.starts == 0 and node.ends == 0:
+            if node.left is None or node.right is None:
+                return node.left if node.left is not None else node.right
+            right, successor = pop_first(node.right)
+            successor.left, successor.right = node.left, right
+            node = successor
+    return rebalance(node)
+
+
+def find(node: Optional[TimeNode], time: int) -> Optional[TimeNode]:
+    while node is not None and node.time != time:
+        node = node.left if time < node.time else node.right
+    return node
+
+
+def range_aggregates(
+    node: Optional[TimeNode],
+    lo: int,
+    hi: int,
+    after: float = NEG_INF,
+    before: float = float("inf"),
+) -> tuple[int, float]:
+    """
+    Return the total and max prefix, as kept by TimeNode, of the times t of the
+    subtree with lo < t < hi, given that all its times are in (after, before).
+    Only the subtrees along the paths to lo and hi are split, so O(log n).
+    """
+    if node is None:
+        return 0, NEG_INF
+    if lo <= after and before <= hi:
+        return node.total, node.max_prefix
+    total, max_prefix = 0, NEG_INF
+    if lo < node.time:
+        total, max_prefix = range_aggregates(node.left, lo, hi, after, node.time)
+    if lo < node.time < hi:
+        total += node.delta
+        max_prefix = max(max_prefix, total)
+    if node.time < hi:
+        right_total, right_prefix = range_aggregates(node.right, lo, hi, node.time, before)
+        max_prefix = max(max_prefix, total + right_prefix)
+        total += right_total
+    return total, max_prefix
+
+
+class DynamicBooking:
+    """
+    Room bookings for a changing set of talk requests.
+
+    A request (s, t) needs a room from time s up to, but not including, time t.
+    The number of talks starting and ending at each time is kept in an AVL tree
+    keyed by time and augmented as in TimeNode, so adding or removing a request
+    and querying the rooms needed at a time or over a range of times take
+    O(log n), and the full schedule, in the format of satisfying_booking, is
+    produced on demand in O(n).
+    """
+
+    def __init__(self, talk_requests: tuple[tuple[int, int], ...] = ()):
+        self.root: Optional[TimeNode] = None
+        self.n_requests = 0
+        for s, t in talk_requests:
+            self.add_request(s, t)
+
+    def __len__(self) -> int:
+        return self.n_requests
+
+    def add_request(self, s: int, t: int) -> None:
+        if not s < t:
+            raise ValueError(f"Talk request ({s}, {t}) must start before it ends")
+        self.root = adjust(self.root, s, 1, 0)
+        self.root = adjust(self.root, t, 0, 1)
+        self.n_requests += 1
+
+    def remove_request(self, s: int, t: int) -> None:
+        """
+        Remove a request added before.
+
+        Raises:
+            ValueError: If no request starts at s or none ends at t. Requests are
+                only counted by their start and end times, so removing (s, t) after
+                adding (s, t') and (s', t) is not detected, and leaves the same
+                bookings as removing them and adding (s', t').
+        """
+        start, end = find(self.root, s), find(self.root, t)
+        if start is None or start.starts == 0 or end is None or end.ends == 0:
+            raise ValueError(f"No talk request ({s}, {t}) to remove")
+        self.root = adjust(self.root, s, -1, 0)
+        self.root = adjust(self.root, t, 0, -1)
+        self.n_requests -= 1
+
+    def rooms_at(self, time: int) -> int:
+        """Return the number of rooms booked at time."""
+        rooms, node = 0, self.root
+        while node is not None:
+            if node.time <= time:
+                rooms += aggregates(node.left)[0] + node.delta
+                node = node.right
+            else:
+                node = node.left
+        return rooms
+
+    def max_rooms(self, lo: int, hi: int) -> int:
+        """Return the largest number of rooms booked at any time in [lo, hi)."""
+        if not lo < hi:
+            raise ValueError(f"Empty time range [{lo}, {hi})")
+        rooms = self.rooms_at(lo)
+        _, max_prefix = range_aggregates(self.root, lo, hi)
+        return max(rooms, rooms + max_prefix)
+
+    def schedule(self) -> Iterator[tuple[int, int, int]]:
+        """
+        Yield the room booking triples (k, s, t) that satisfy the current requests,
+        in order, as satisfying_booking returns them.
+        """
+        n_rooms, start = 0, None
+        for node in self.nodes():
+            if node.delta == 0:
+                continue
+            if start is not None:
+                yield n_rooms, start, node.time
+            n_rooms, start = n_rooms + node.delta, node.time
+
+    def nodes(self) -> Iterator[TimeNode]:
+        # in time order, with an explicit stack
+        stack, node = [], self.root
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node
+            node = node.right
+
+
+if __name__ == "__main__":
+    booking = DynamicBooking([(0, 2), (3, 4), (1, 15), (0, 3), (0, 10), (0, 14)])
+    print(tuple(booking.schedule()))
+    booking.remove_request(1, 15)
+    booking.add_request(5, 6)
+    print(tuple(booking.schedule()), booking.rooms_at(5), booking.max_rooms(0, 20))
@@ -70,6 +70,40 @@ def satisfying_booking(
     )
 
 
+def satisfying_booking_fast(
+    talk_requests: list[tuple[int, int]]
+) -> tuple[tuple[int, int, int], ...]:
+    """
+    Input:  R | Tuple of |R| talk request tuples (s, t)
+    Output: B | Tuple of room booking triples (k, s, t)
+              | that is the booking schedule that satisfies R,
+              | the same as satisfying_booking
+
+    Sorts all start and end times together as single ints (time << 1 | is_start),
+    then sweeps them once, adding the net change in rooms at each distinct time.
+    A booking ends wherever that change is not zero.
+    """
+    events = [s << 1 | 1 for s, _ in talk_requests]
+    events += [t << 1 for _, t in talk_requests]
+    events.sort()
+    schedule = []
+    # rooms booked since the last change, at time start
+    n_rooms, start = 0, None
+    time, d = None, 0
+    for event in events:
+        if event >> 1 != time:
+            if d != 0:
+                if start is not None:
+                    schedule.append((n_rooms, start, time))
+                n_rooms, start = n_rooms + d, time
+            time, d = event >> 1, 0
+        # +1 for a start, -1 for an end
+        d += (event & 1) * 2 - 1
+    if d != 0 and start is not None:
+        schedule.append((n_rooms, start, time))
+    return tuple(schedule)
+
+
 def get_counts(sorted_numbers: Iterable[int]) -> list[Item]:
     if not sorted_numbers:
         return []
@@ -90,3 +124,4 @@ if __name__ == "__main__":
     r = [(0, 2), (3, 4), (1, 15), (0, 3), (0, 10), (0, 14)]
     s = satisfying_booking(r)
     print(s)
+    print(satisfying_booking_fast(r))
@@ -1,5 +1,6 @@
 import unittest
-from satisfying_booking     import satisfying_booking
+from satisfying_booking     import satisfying_booking, satisfying_booking_fast
+from dynamic_booking        import DynamicBooking
 
 tests = (
     (
@@ -24,9 +25,9 @@ tests = (
     ),
 )
 
-def check(test):
+def check(test, solve = satisfying_booking):
     R, staff_sol = test
-    student_sol = satisfying_booking(R)
+    student_sol = solve(R)
     n1 = len(staff_sol)
     n2 = len(student_sol)
     if n1 != n2: return False
@@ -38,6 +39,9 @@ def check(test):
             if b1[j] != b2[j]:  return False
     return True
 
+def dynamic_booking(R):
+    return tuple(DynamicBooking(R).schedule())
+
 class TestCases(unittest.TestCase):
     def test_01(self): self.assertTrue(check(tests[ 0]))
     def test_02(self): self.assertTrue(check(tests[ 1]))
@@ -45,5 +49,41 @@ class TestCases(unittest.TestCase):
     def test_04(self): self.assertTrue(check(tests[ 3]))
     def test_05(self): self.assertTrue(check(tests[ 4]))
 
+class FastTestCases(unittest.TestCase):
+    def test_01(self): self.assertTrue(check(tests[ 0], satisfying_booking_fast))
+    def test_02(self): self.assertTrue(check(tests[ 1], satisfying_booking_fast))
+    def test_03(self): self.assertTrue(check(tests[ 2], satisfying_booking_fast))
+    def test_04(self): self.assertTrue(check(tests[ 3], satisfying_booking_fast))
+    def test_05(self): self.assertTrue(check(tests[ 4], satisfying_booking_fast))
+
+class DynamicTestCases(unittest.TestCase):
+    def test_01(self): self.assertTrue(check(tests[ 0], dynamic_booking))
+    def test_02(self): self.assertTrue(check(tests[ 1], dynamic_booking))
+    def test_03(self): self.assertTrue(check(tests[ 2], dynamic_booking))
+    def test_04(self): self.assertTrue(check(tests[ 3], dynamic_booking))
+    def test_05(self): self.assertTrue(check(tests[ 4], dynamic_booking))
+
+    def test_remove_requests(self):
+        R = tests[4][0]
+        booking = DynamicBooking(R)
+        for s, t in R[::2]:
+            booking.remove_request(s, t)
+        self.assertEqual(tuple(booking.schedule()), satisfying_booking(R[1::2]))
+        self.assertEqual(len(booking), len(R[1::2]))
+        with self.assertRaises(ValueError):
+            booking.remove_request(*R[0])
+
+    def test_rooms(self):
+        R = tests[1][0]
+        booking = DynamicBooking(R)
+        for k, s, t in satisfying_booking(R):
+            self.assertEqual(booking.rooms_at(s), k)
+            self.assertEqual(booking.rooms_at(t - 1), k)
+            self.assertEqual(booking.max_rooms(s, t), k)
+        self.assertEqual(booking.rooms_at(1), 0)
+        self.assertEqual(booking.rooms_at(100), 0)
+        self.assertEqual(booking.max_rooms(0, 200), 6)
+        self.assertEqual(booking.max_rooms(20, 72), 5)
+
 if __name__ == '__main__':
    res = unittest.main(verbosity = 3, exit = False)
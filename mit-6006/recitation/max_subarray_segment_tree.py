@@ -0,0 +1,85 @@
+from typing import Iterable, Union
+from streaming_max_subarray import EMPTY, NEG_INF, Summary, combine, summarize
+
+Number = Union[int, float]
+
+
+class MaxSubarraySegmentTree:
+    """
+    Maximum subarray sums of any range of a list of numbers under point updates.
+
+    A bottom-up segment tree stored in a flat list of 2n summaries (total, best
+    prefix, best suffix, best subarray, as in `streaming_max_subarray`): the
+    numbers are the leaves at positions n to 2n - 1, and position i holds the
+    combined summary of positions 2i and 2i + 1. Building takes O(n) time, and
+    an update or a range query visits O(log n) positions, so a change to one
+    number no longer needs a full recomputation by `max_subarray_sum`.
+
+    Example:
+    >>> tree = MaxSubarraySegmentTree([-9, 1, -5, 4, 3, -6, 7, 8, -2])
+    >>> tree.query(0, 8), tree.query(0, 4)
+    (16, 7)
+    >>> tree.update(5, 0)
+    >>> tree.query(0, 8)
+    22
+    """
+
+    def __init__(self, numbers: Iterable[Number]):
+        leaves = [summarize(x) for x in numbers]
+        self.n = len(leaves)
+        self.tree: list[Summary] = [EMPTY] * self.n + leaves
+        for i in range(self.n - 1, 0, -1):
+            self.tree[i] = combine(self.tree[2 * i], self.tree[2 * i + 1])
+
+    def __len__(self) -> int:
+        return self.n
+
+    def __getitem__(self, i: int) -> Number:
+        if not 0 <= i < self.n:
+            raise IndexError(f"Index {i} out of range for {self.n} numbers")
+        return self.tree[self.n + i][0]
+
+    def update(self, i: int, value: Number) -> None:
+        """Set the number at index i to value, in O(log n)."""
+        if not 0 <= i < self.n:
+            raise IndexError(f"Index {i} out of range for {self.n} numbers")
+        i += self.n
+        self.tree[i] = summarize(value)
+        i >>= 1
+        while i > 0:
+            self.tree[i] = combine(self.tree[2 * i], self.tree[2 * i + 1])
+            i >>= 1
+
+    def summary(self, lo: int, hi: int) -> Summary:
+        """Return the summary of numbers[lo..hi], with hi inclusive."""
+        if not 0 <= lo <= hi < self.n:
+            raise IndexError(f"Range [{lo}, {hi}] out of bounds for {self.n} numbers")
+        # combine is not commutative, so the pieces left of the range and right
+        # of it are accumulated separately, each in order
+        left, right = EMPTY, EMPTY
+        lo, hi = lo + self.n, hi + self.n + 1
+        while lo < hi:
+            if lo & 1:
+                left = combine(left, self.tree[lo])
+                lo += 1
+            if hi & 1:
+                hi -= 1
+                right = combine(self.tree[hi], right)
+            lo >>= 1
+            hi >>= 1
+        return combine(left, right)
+
+    def query(self, lo: int, hi: int) -> Number:
+        """Return the largest sum of a non-empty subarray of numbers[lo..hi], in O(log n)."""
+        return self.summary(lo, hi)[3]
+
+    def max_sum(self) -> Number:
+        """Return the largest subarray sum of all the numbers, -inf if there are none."""
+        return self.query(0, self.n - 1) if self.n else NEG_INF
+
+
+if __name__ == "__main__":
+    tree = MaxSubarraySegmentTree([-9, 1, -5, 4, 3, -6, 7, 8, -2])
+    print(tree.max_sum())
+    tree.update(2, 5)
+    print(tree.max_sum(), tree.query(0, 3))
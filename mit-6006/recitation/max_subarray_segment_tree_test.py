@@ -0,0 +1,40 @@
+"""
+Tests for max_subarray_segment_tree.py
+"""
+
+import random
+import unittest
+from max_subarray_sum import max_subarray_sum
+from max_subarray_segment_tree import MaxSubarraySegmentTree
+
+
+class TestMaxSubarraySegmentTree(unittest.TestCase):
+
+    def test_queries_after_updates(self):
+        rng = random.Random(6006)
+        for n in (1, 2, 7, 16, 33):
+            numbers = [rng.randint(-10, 10) for _ in range(n)]
+            tree = MaxSubarraySegmentTree(numbers)
+            for _ in range(30):
+                i = rng.randrange(n)
+                numbers[i] = rng.randint(-10, 10)
+                tree.update(i, numbers[i])
+                self.assertEqual(tree[i], numbers[i])
+                self.assertEqual(tree.max_sum(), max_subarray_sum(numbers))
+                lo = rng.randrange(n)
+                hi = rng.randrange(lo, n)
+                self.assertEqual(tree.query(lo, hi), max_subarray_sum(numbers[lo : hi + 1]))
+
+    def test_bounds(self):
+        tree = MaxSubarraySegmentTree([1, -2, 3])
+        with self.assertRaises(IndexError):
+            tree.update(3, 0)
+        with self.assertRaises(IndexError):
+            tree.query(2, 1)
+        with self.assertRaises(IndexError):
+            tree.query(0, 3)
+        self.assertEqual(MaxSubarraySegmentTree([]).max_sum(), float("-inf"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,3 +1,8 @@
+from typing import Iterable, Union
+
+Number = Union[int, float]
+
+
 def subarray_sum_iterative(numbers: list[int]):
     """
     Compute all subarray sums of a list of integers
@@ -46,13 +51,48 @@ def subarray_sum_iterative(numbers: list[int]):
     return subsums, max_sum
 
 
-def max_subarray_sum(numbers: list[int]):
+def max_subarray(numbers: Iterable[Number]) -> tuple[Number, int, int]:
+    """
+    Find a non-empty subarray with the largest sum in a single pass (Kadane's algorithm).
+
+    The best sum ending at each index is either the number there alone or the number
+    appended to the best sum ending just before it, whichever is larger. Only that
+    running sum and the best one seen so far are kept, so the input can be any
+    iterable, such as a generator over a stream too long to hold in memory.
+    This takes O(n) time and O(1) extra memory.
+
+    Args:
+        numbers (Iterable[int | float]): The numbers to scan, consumed once.
+
+    Returns:
+        tuple: A tuple containing:
+            - int | float: The largest subarray sum, or -inf if numbers is empty.
+            - int: The index of the first number of that subarray.
+            - int: The index of the last number of that subarray, inclusive,
+              so an empty input gives the empty range (0, -1).
+
+        For example, `max_subarray([-9, 1, -5, 4, 3, -6, 7, 8, -2])` returns (16, 3, 7).
+    """
+    best, best_start, best_end = float("-inf"), 0, -1
+    current, start = 0, 0
+    for j, x in enumerate(numbers):
+        if current <= 0:
+            # a subarray ending at j - 1 can only lower the sum
+            current, start = x, j
+        else:
+            current += x
+        if current > best:
+            best, best_start, best_end = current, start, j
+    return best, best_start, best_end
+
+
+def max_subarray_sum(numbers: Iterable[int]):
     """
     Find the largest sum of any non-empty subarray in the given array.
     A subarray is defined as a contiguous sequence of elements within the array.
 
     Parameters:
-    arr (list of int): The input array of integers.
+    numbers (iterable of int): The input integers, e.g. a list or a generator.
 
     Returns:
     int: The largest sum of any non-empty subarray.
@@ -61,10 +101,11 @@ def max_subarray_sum(numbers: list[int]):
     >>> max_subarray_sum([-9, 1, -5, 4, 3, -6, 7, 8, -2])
     16
     """
-    _, max_subsum = subarray_sum_iterative(numbers)
+    max_subsum, _, _ = max_subarray(numbers)
     return max_subsum
 
 
 if __name__ == "__main__":
     print(max_subarray_sum([-9, 1, -5, 4, 3, -6, 7, 8, -2]))
+    print(max_subarray(x % 7 - 3 for x in range(20)))
     print(subarray_sum_iterative([]))
@@ -0,0 +1,34 @@
+"""
+Tests for max_subarray_sum.py
+"""
+
+import random
+import unittest
+from max_subarray_sum import max_subarray, max_subarray_sum, subarray_sum_iterative
+
+
+class TestMaxSubarray(unittest.TestCase):
+
+    def test_example(self):
+        numbers = [-9, 1, -5, 4, 3, -6, 7, 8, -2]
+        self.assertEqual(max_subarray(numbers), (16, 3, 7))
+        self.assertEqual(max_subarray_sum(numbers), 16)
+
+    def test_matches_all_subarray_sums(self):
+        rng = random.Random(6006)
+        for n in range(1, 30):
+            numbers = [rng.randint(-10, 10) for _ in range(n)]
+            _, expected = subarray_sum_iterative(numbers)
+            best, start, end = max_subarray(iter(numbers))
+            self.assertEqual(best, expected)
+            self.assertLessEqual(start, end)
+            self.assertEqual(sum(numbers[start : end + 1]), best)
+
+    def test_edge_cases(self):
+        self.assertEqual(max_subarray([]), (float("-inf"), 0, -1))
+        self.assertEqual(max_subarray([-3, -1, -2]), (-1, 1, 1))
+        self.assertEqual(max_subarray_sum(x - 5 for x in range(10)), 10)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,113 @@
+import mmap
+from array import array
+from itertools import accumulate
+from operator import sub
+from typing import Iterable, Union
+
+Number = Union[int, float]
+
+# header of a saved index, followed by its typecode and padding to 8 bytes
+MAGIC = b"PSUM"
+HEADER_SIZE = 8
+
+
+class PrefixSumIndex:
+    """
+    Answer subarray sum queries in O(1) from the prefix sums of a list of numbers.
+
+    The index stores prefix[k] = numbers[0] + ... + numbers[k - 1] for k from 0 to n,
+    so the sum of numbers[i..j] is prefix[j + 1] - prefix[i]. It is built in O(n) time
+    and takes 8 bytes per number, in place of the O(n^2) nested dictionary of all
+    subarray sums built by `subarray_sum_iterative`.
+
+    An index can be saved to a file and memory-mapped back, so that large indexes
+    are shared between processes and paged in on demand instead of loaded.
+
+    Example:
+    >>> index = PrefixSumIndex([1, 2, 3])
+    >>> index.range_sum(0, 2), index.range_sum(1, 2)
+    (6, 5)
+    """
+
+    def __init__(self, numbers: Iterable[Number] = (), typecode: str = "q"):
+        """
+        Build the index of numbers.
+
+        Args:
+            numbers (Iterable[int | float]): The numbers to index.
+            typecode (str): The array typecode of the prefix sums, "q" for
+                64-bit integers or "d" for floats.
+        """
+        self.typecode = typecode
+        self.prefix = array(typecode, accumulate(numbers, initial=0))
+
+    def __len__(self) -> int:
+        return len(self.prefix) - 1
+
+    def range_sum(self, i: int, j: int) -> Number:
+        """
+        Return the sum of numbers[i..j], with j inclusive; 0 if j == i - 1.
+
+        Raises:
+            IndexError: If the range is not within the indexed numbers.
+        """
+        if not 0 <= i <= j + 1 <= len(self):
+            raise IndexError(f"Range [{i}, {j}] out of bounds for {len(self)} numbers")
+        return self.prefix[j + 1] - self.prefix[i]
+
+    def range_sums(self, pairs: Iterable[tuple[int, int]]) -> array:
+        """
+        Return the sums of many ranges at once, as range_sum would.
+
+        Args:
+            pairs (Iterable[tuple[int, int]]): The (i, j) bounds of each range.
+
+        Returns:
+            array: The sum of each range, in order.
+        """
+        starts, ends = [], []
+        for i, j in pairs:
+            if not 0 <= i <= j + 1 <= len(self):
+                raise IndexError(f"Range [{i}, {j}] out of bounds for {len(self)} numbers")
+            starts.append(i)
+            ends.append(j + 1)
+        prefix = self.prefix
+        return array(
+            self.typecode,
+            map(sub, map(prefix.__getitem__, ends), map(prefix.__getitem__, starts)),
+        )
+
+    def save(self, path: str) -> None:
+        """Write the index to path, in a format that load can memory-map."""
+        header = MAGIC + self.typecode.encode()
+        with open(path, "wb") as f:
+            f.write(header.ljust(HEADER_SIZE, b"\0"))
+            f.write(self.prefix)
+
+    @classmethod
+    def load(cls, path: str) -> "PrefixSumIndex":
+        """
+        Memory-map an index written by save, without reading it into memory.
+
+        Raises:
+            ValueError: If path does not hold a saved index.
+        """
+        with open(path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        header = mapped[:HEADER_SIZE]
+        typecode = chr(header[len(MAGIC)]) if len(header) == HEADER_SIZE else ""
+        if not header.startswith(MAGIC) or typecode not in ("q", "d"):
+            raise ValueError(f"{path} is not a saved prefix sum index")
+        if (len(mapped) - HEADER_SIZE) % 8:
+            raise ValueError(f"{path} holds a partial prefix sum")
+        index = cls.__new__(cls)
+        index.typecode = typecode
+        # a memoryview indexes like the array, reading straight from the map
+        index.prefix = memoryview(mapped)[HEADER_SIZE:].cast(typecode)
+        return index
+
+
+if __name__ == "__main__":
+    index = PrefixSumIndex([-9, 1, -5, 4, 3, -6, 7, 8, -2])
+    print(index.range_sum(3, 7))
+    print(index.range_sums([(0, 8), (2, 4), (5, 4)]))
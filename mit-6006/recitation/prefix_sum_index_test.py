@@ -0,0 +1,66 @@
+"""
+Tests for prefix_sum_index.py
+"""
+
+import os
+import random
+import tempfile
+import unittest
+from max_subarray_sum import subarray_sum_iterative
+from prefix_sum_index import PrefixSumIndex
+
+
+class TestPrefixSumIndex(unittest.TestCase):
+
+    def setUp(self):
+        rng = random.Random(6006)
+        self.numbers = [rng.randint(-100, 100) for _ in range(40)]
+        self.index = PrefixSumIndex(self.numbers)
+
+    def test_matches_all_subarray_sums(self):
+        subsums, _ = subarray_sum_iterative(self.numbers)
+        for i, sums in subsums.items():
+            for j, total in sums.items():
+                self.assertEqual(self.index.range_sum(i, j), total)
+
+    def test_range_sums(self):
+        pairs = [(i, j) for i in range(len(self.numbers)) for j in range(i - 1, len(self.numbers))]
+        sums = self.index.range_sums(pairs)
+        self.assertEqual(list(sums), [self.index.range_sum(i, j) for i, j in pairs])
+        self.assertEqual(sums.typecode, "q")
+
+    def test_bounds(self):
+        n = len(self.numbers)
+        for i, j in ((-1, 3), (3, 1), (0, n), (n + 1, n)):
+            with self.assertRaises(IndexError):
+                self.index.range_sum(i, j)
+        with self.assertRaises(IndexError):
+            self.index.range_sums([(0, 1), (2, n)])
+        self.assertEqual(PrefixSumIndex().range_sum(0, -1), 0)
+
+    def test_save_load(self):
+        floats = PrefixSumIndex([0.5, -1.25, 2.0], typecode="d")
+        with tempfile.TemporaryDirectory() as tmp:
+            for index in (self.index, floats):
+                path = os.path.join(tmp, "index.bin")
+                index.save(path)
+                loaded = PrefixSumIndex.load(path)
+                self.assertEqual(len(loaded), len(index))
+                pairs = [(0, len(index) - 1), (1, 1), (2, 1)]
+                self.assertEqual(list(loaded.range_sums(pairs)), list(index.range_sums(pairs)))
+                del loaded
+            path = os.path.join(tmp, "other.bin")
+            with open(path, "wb") as f:
+                f.write(b"not an index")
+            with self.assertRaises(ValueError):
+                PrefixSumIndex.load(path)
+            # a valid header, but a payload cut short of a whole prefix sum
+            self.index.save(path)
+            with open(path, "ab") as f:
+                f.write(b"\0" * 3)
+            with self.assertRaises(ValueError):
+                PrefixSumIndex.load(path)
+
+
+if __name__ == "__main__":
+    unittest.main()
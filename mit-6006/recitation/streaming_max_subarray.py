@@ -0,0 +1,296 @@
+import heapq
+from typing import Iterable, Optional, Union
+
+Number = Union[int, float]
+# (total, best prefix sum, best suffix sum, best subarray sum) of a non-empty
+# run of numbers, where prefixes, suffixes and subarrays are non-empty
+Summary = tuple[Number, Number, Number, Number]
+
+NEG_INF = float("-inf")
+# summary of the empty run, which combine leaves other summaries unchanged by
+EMPTY: Summary = (0, NEG_INF, NEG_INF, NEG_INF)
+
+
+def summarize(x: Number) -> Summary:
+    return (x, x, x, x)
+
+
+def combine(left: Summary, right: Summary) -> Summary:
+    """
+    Summarize the concatenation of two runs from their summaries.
+
+    The best subarray of the concatenation lies in one of the two runs, or is a
+    suffix of the left one followed by a prefix of the right one. combine is
+    associative, so summaries can be merged in any grouping.
+    """
+    left_total, left_prefix, left_suffix, left_best = left
+    right_total, right_prefix, right_suffix, right_best = right
+    return (
+        left_total + right_total,
+        max(left_prefix, left_total + right_prefix),
+        max(right_suffix, right_total + left_suffix),
+        max(left_best, right_best, left_suffix + right_prefix),
+    )
+
+
+class SlidingWindowMaxSubarray:
+    """
+    Maximum subarray sum over the last `window` numbers of a stream.
+
+    The window is a queue built from two stacks, each entry of which keeps the
+    summary of the numbers from it to the bottom of its stack. New numbers are
+    pushed on the back stack. Old numbers are popped from the front stack, which
+    is refilled from the back stack whenever it runs empty, so each number moves
+    once. The summary of the window combines the tops of the two stacks, so an
+    append takes amortized O(1) time and the window O(window) memory.
+
+    Example:
+    >>> window = SlidingWindowMaxSubarray(3)
+    >>> [window.append(x) for x in [2, -1, 2, -5, 4]]
+    [2, 2, 3, 2, 4]
+    """
+
+    def __init__(self, window: int):
+        if window < 1:
+            raise ValueError(f"Window must hold at least one number, got {window}")
+        self.window = window
+        # (number, summary of it and the entries below it)
+        self.front: list[tuple[Number, Summary]] = []
+        self.back: list[tuple[Number, Summary]] = []
+
+    def __len__(self) -> int:
+        return len(self.front) + len(self.back)
+
+    def append(self, x: Number) -> Number:
+        """Add x to the window, dropping the oldest number if full, and return max_sum()."""
+        if len(self) == self.window:
+            self.pop_oldest()
+        below = self.back[-1][1] if self.back else EMPTY
+        self.back.append((x, combine(below, summarize(x))))
+        return self.max_sum()
+
+    def extend(self, numbers: Iterable[Number]) -> Number:
+        for x in numbers:
+            self.append(x)
+        return self.max_sum()
+
+    def pop_oldest(self) -> Number:
+        if not self.front:
+            # the oldest number goes on top, so push from the newest one down,
+            # each summarizing the numbers from it to the newest
+            above = EMPTY
+            while self.back:
+                x, _ = self.back.pop()
+                above = combine(summarize(x), above)
+                self.front.append((x, above))
+        x, _ = self.front.pop()
+        return x
+
+    def summary(self) -> Summary:
+        front = self.front[-1][1] if self.front else EMPTY
+        back = self.back[-1][1] if self.back else EMPTY
+        return combine(front, back)
+
+    def max_sum(self) -> Number:
+        """Return the largest sum of a non-empty subarray of the window, -inf if empty."""
+        return self.summary()[3]
+
+
+class Run:
+    """A maximal run of positive numbers, or of numbers <= 0, in TopKDisjointSubarrays."""
+
+    __slots__ = ("total", "start", "end", "prev", "next", "alive")
+
+    def __init__(self, total: Number, start: int, end: int):
+        self.total, self.start, self.end = total, start, end
+        self.prev: Optional["Run"] = None
+        self.next: Optional["Run"] = None
+        self.alive = True
+
+
+class TopKDisjointSubarrays:
+    """
+    The at most k disjoint subarrays of a stream with the largest total sum.
+
+    The stream is kept as alternating runs of positive numbers and of numbers
+    <= 0; the best j disjoint subarrays are j of the positive runs, possibly
+    merged across the runs between them. While there are more than k positive
+    runs, the run with the smallest absolute total is taken out of a heap and
+    merged with its two neighbors, or dropped with its neighbor if it is a
+    positive run at either end. Each such step costs the least it can, so it
+    turns the best j + 1 subarrays into the best j.
+
+    The last run can still grow, so it enters the heap once the next run
+    starts. The steps on runs smaller than the last run come out the same
+    whatever follows, so they are done as numbers are appended, and the rest
+    are left to top(), which finishes the merging on a copy of the runs in
+    O(m log m), m being the number of runs kept, and keeps the result until
+    the next append. An append takes amortized O(log m) time. m stays close
+    to 2k unless the runs keep getting smaller, as the steps on the larger
+    runs before them depend on what comes next.
+
+    Example:
+    >>> top = TopKDisjointSubarrays(2)
+    >>> top.extend([5, -1, 5, -9, 3])
+    >>> top.top()
+    [(9, 0, 2), (3, 4, 4)]
+    """
+
+    def __init__(self, k: int):
+        if k < 1:
+            raise ValueError(f"k must be positive, got {k}")
+        self.k = k
+        self.n = 0
+        self.head: Optional[Run] = None
+        self.tail: Optional[Run] = None
+        self.n_positive = 0
+        # number of runs in the list
+        self.size = 0
+        # (abs total, order pushed, run) of runs that no longer grow
+        self.heap: list[tuple[Number, int, Run]] = []
+        self.pushed = 0
+        # largest number and its index, the answer while no number is positive
+        self.largest: tuple[Number, int] = (NEG_INF, -1)
+        # result of top() since the last append
+        self.best: Optional[list[tuple[Number, int, int]]] = None
+
+    def append(self, x: Number) -> None:
+        if x > self.largest[0]:
+            self.largest = (x, self.n)
+        tail = self.tail
+        if tail is not None and (tail.total > 0) == (x > 0):
+            tail.total += x
+            tail.end = self.n
+        elif tail is not None or x > 0:
+            # runs <= 0 before the first positive number are never used
+            run = Run(x, self.n, self.n)
+            if tail is None:
+                self.head = run
+            else:
+                tail.next, run.prev = run, tail
+                self.push(tail)
+            self.tail = run
+            self.size += 1
+            if x > 0:
+                self.n_positive += 1
+        self.n += 1
+        self.best = None
+        self.merge(final=False)
+
+    def extend(self, numbers: Iterable[Number]) -> None:
+        for x in numbers:
+            self.append(x)
+
+    def push(self, run: Run) -> None:
+        heapq.heappush(self.heap, (abs(run.total), self.pushed, run))
+        self.pushed += 1
+        if len(self.heap) > 2 * self.size + 16:
+            # drop the entries of merged runs, so the heap stays O(m)
+            self.heap = [entry for entry in self.heap if entry[2].alive]
+            heapq.heapify(self.heap)
+
+    def threshold(self) -> Number:
+        # size of the last run: it only grows in size, whether by appending or,
+        # if not positive, by merging what follows, so the steps on smaller runs
+        # come before any step on it and are the same whatever comes next
+        return abs(self.tail.total) if self.tail is not None else 0
+
+    def merge(self, final: bool) -> None:
+        # merge runs until at most k are positive; unless the stream is final,
+        # stop at the first step that may still change as the stream grows
+        while self.n_positive > self.k and self.heap:
+            magnitude, _, run = self.heap[0]
+            if not run.alive:
+                heapq.heappop(self.heap)
+                continue
+            if not final and magnitude >= self.threshold():
+                return
+            heapq.heappop(self.heap)
+            self.take(run, final)
+
+    def take(self, run: Run, final: bool) -> None:
+        # merge run with its neighbors, which removes one positive run
+        prev, next = run.prev, run.next
+        run.alive = False
+        self.n_positive -= 1
+        if prev is None or next is None:
+            # a positive run at an end goes, with the run <= 0 next to it
+            neighbor = prev if next is None else next
+            outer = None
+            self.size -= 1
+            if neighbor is not None:
+                neighbor.alive = False
+                self.size -= 1
+                outer = neighbor.prev if next is None else neighbor.next
+            if next is None:
+                self.tail = outer
+                if outer is not None:
+                    outer.next = None
+            else:
+                self.head = outer
+                if outer is not None:
+                    outer.prev = None
+            if self.head is None or self.tail is None:
+                self.head = self.tail = None
+            return
+        merged = Run(prev.total + run.total + next.total, prev.start, next.end)
+        self.size -= 2
+        prev.alive = next.alive = False
+        merged.prev, merged.next = prev.prev, next.next
+        if merged.prev is None:
+            self.head = merged
+        else:
+            merged.prev.next = merged
+        if merged.next is None:
+            self.tail = merged
+        else:
+            merged.next.prev = merged
+        # a tail that can still grow is pushed once the next run starts
+        if merged.next is not None or final:
+            self.push(merged)
+
+    def top(self) -> list[tuple[Number, int, int]]:
+        """
+        Return the (sum, start, end) of the at most k disjoint subarrays with the
+        largest total, with inclusive ends, largest sum first. If no number is
+        positive, this is the largest number alone.
+        """
+        if self.n_positive == 0:
+            return [(self.largest[0], self.largest[1], self.largest[1])] if self.n else []
+        if self.best is not None:
+            return list(self.best)
+        # finish the merging on a copy, where the runs no longer grow
+        copy = TopKDisjointSubarrays(self.k)
+        prev = None
+        run = self.head
+        while run is not None:
+            if run.total > 0 or run.next is not None:
+                clone = Run(run.total, run.start, run.end)
+                if prev is None:
+                    copy.head = clone
+                else:
+                    prev.next, clone.prev = clone, prev
+                copy.size += 1
+                copy.push(clone)
+                prev = clone
+                if run.total > 0:
+                    copy.n_positive += 1
+            run = run.next
+        copy.tail = prev
+        copy.merge(final=True)
+        result = []
+        run = copy.head
+        while run is not None:
+            if run.total > 0:
+                result.append((run.total, run.start, run.end))
+            run = run.next
+        self.best = sorted(result, key=lambda best: (-best[0], best[1]))
+        return list(self.best)
+
+
+if __name__ == "__main__":
+    window = SlidingWindowMaxSubarray(4)
+    print([window.append(x) for x in [-9, 1, -5, 4, 3, -6, 7, 8, -2]])
+    top = TopKDisjointSubarrays(2)
+    top.extend([-9, 1, -5, 4, 3, -6, 7, 8, -2])
+    print(top.top())
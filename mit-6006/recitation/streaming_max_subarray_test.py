@@ -0,0 +1,98 @@
+"""
+Tests for streaming_max_subarray.py
+"""
+
+import random
+import unittest
+from max_subarray_sum import max_subarray
+from streaming_max_subarray import NEG_INF, SlidingWindowMaxSubarray, TopKDisjointSubarrays
+
+
+class TestSlidingWindowMaxSubarray(unittest.TestCase):
+
+    def test_matches_recomputing_each_window(self):
+        rng = random.Random(6006)
+        numbers = [rng.randint(-20, 20) for _ in range(300)]
+        for w in (1, 2, 5, 17):
+            window = SlidingWindowMaxSubarray(w)
+            for j, x in enumerate(numbers):
+                expected, _, _ = max_subarray(numbers[max(0, j - w + 1) : j + 1])
+                self.assertEqual(window.append(x), expected)
+                self.assertEqual(len(window), min(j + 1, w))
+
+    def test_empty_and_invalid(self):
+        self.assertEqual(SlidingWindowMaxSubarray(3).max_sum(), float("-inf"))
+        with self.assertRaises(ValueError):
+            SlidingWindowMaxSubarray(0)
+
+
+def best_total(numbers, k):
+    # largest total of 1 to k disjoint non-empty subarrays, by dynamic programming
+    # over the best totals with j subarrays, the last one ending here or earlier
+    ending, ended = [NEG_INF] * (k + 1), [0] + [NEG_INF] * k
+    for x in numbers:
+        for j in range(k, 0, -1):
+            ending[j] = max(ending[j], ended[j - 1]) + x
+            ended[j] = max(ended[j], ending[j])
+    return max(ended[1:])
+
+
+class TestTopKDisjointSubarrays(unittest.TestCase):
+
+    def test_matches_dynamic_programming(self):
+        rng = random.Random(1)
+        for _ in range(300):
+            numbers = [rng.randint(rng.choice((-10, -1)), 10) for _ in range(rng.randint(1, 40))]
+            k = rng.randint(1, 5)
+            top = TopKDisjointSubarrays(k)
+            for n, x in enumerate(numbers, 1):
+                top.append(x)
+                result = top.top()
+                self.assertLessEqual(len(result), k)
+                self.assertEqual(sum(s for s, _, _ in result), best_total(numbers[:n], k))
+                for best, i, j in result:
+                    self.assertEqual(sum(numbers[i : j + 1]), best)
+                # the subarrays do not overlap
+                spans = sorted((i, j) for _, i, j in result)
+                for (_, j), (i, _) in zip(spans, spans[1:]):
+                    self.assertLess(j, i)
+
+    def test_examples(self):
+        top = TopKDisjointSubarrays(2)
+        top.extend([5, -1, 5])
+        self.assertEqual(top.top(), [(5, 0, 0), (5, 2, 2)])
+        top = TopKDisjointSubarrays(1)
+        top.extend([5, -1, 5])
+        self.assertEqual(top.top(), [(9, 0, 2)])
+        top = TopKDisjointSubarrays(3)
+        top.extend([-4, -2, -7])
+        self.assertEqual(top.top(), [(-2, 1, 1)])
+
+    def test_runs_kept(self):
+        rng = random.Random(2)
+        top = TopKDisjointSubarrays(3)
+        top.extend(rng.randint(-10, 10) for _ in range(20000))
+        self.assertLess(top.size, 100)
+        self.assertLess(len(top.heap), 2 * top.size + 17)
+
+    def test_runs_kept_falling_peaks(self):
+        # each peak is smaller than the last, but cut off from it by a larger dip
+        top = TopKDisjointSubarrays(1)
+        for i in range(20000):
+            top.extend([10**6 - i, -10**7])
+            self.assertLess(top.size, 10)
+            self.assertLess(len(top.heap), 2 * top.size + 17)
+        self.assertEqual(top.top(), [(10**6, 0, 0)])
+        # the result is kept until the next append
+        self.assertIs(top.top()[0], top.top()[0])
+        top.append(2 * 10**7)
+        self.assertEqual(top.top(), [(2 * 10**7, 40000, 40000)])
+
+    def test_empty_and_invalid(self):
+        self.assertEqual(TopKDisjointSubarrays(2).top(), [])
+        with self.assertRaises(ValueError):
+            TopKDisjointSubarrays(0)
+
+
+if __name__ == "__main__":
+    unittest.main()
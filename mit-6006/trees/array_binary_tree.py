@@ -0,0 +1,353 @@
+"""This module implements an AVL set tree whose nodes live in parallel arrays."""
+
+from __future__ import annotations
+from array import array
+from typing import Any, Iterable
+
+# node id used for a missing child or parent
+NIL = -1
+
+
+class ArraySetBinaryTree:
+    """
+    AVL tree representing a set of items with unique keys.
+
+    Offers the same interface as SetBinaryTree, but instead of one BSTNode
+    object per item the node fields are stored in parallel columns indexed
+    by an integer node id. Slots of deleted nodes are kept on a free list
+    and reused by later inserts.
+
+    Attributes:
+        items (list): The item stored at each node id.
+        left (array): Node id of the left child, NIL if absent.
+        right (array): Node id of the right child, NIL if absent.
+        parent (array): Node id of the parent, NIL for the root.
+        height (array): Height of the subtree rooted at each node id.
+        root (int): Node id of the root, NIL if the tree is empty.
+        size (int): The number of items in the tree.
+    """
+
+    def __init__(self):
+        self.items: list[Any] = []
+        self.left = array("i")
+        self.right = array("i")
+        self.parent = array("i")
+        self.height = array("b")
+        self.free = array("i")
+        self.root = NIL
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+        """
+        Iterate over the items in traversal order.
+
+        Yields:
+            Any: The next item in the tree.
+        """
+        left, right, items = self.left, self.right, self.items
+        stack = []
+        node = self.root
+        while stack or node != NIL:
+            while node != NIL:
+                stack.append(node)
+                node = left[node]
+            node = stack.pop()
+            yield items[node]
+            node = right[node]
+
+    def iter_order(self):
+        yield from self
+
+    def build(self, X: Iterable[Any]):
+        """
+        Build the tree by inserting elements from the iterable X.
+
+        Args:
+            X (iterable): An iterable collection of elements to be inserted into the tree.
+        """
+        for x in X:
+            self.insert(x)
+
+    def new_node(self, x: Any) -> int:
+        # allocate a leaf for item x, reusing a freed slot if there is one
+        if self.free:
+            node = self.free.pop()
+            self.items[node] = x
+            self.left[node] = self.right[node] = self.parent[node] = NIL
+            self.height[node] = 0
+            return node
+        self.items.append(x)
+        self.left.append(NIL)
+        self.right.append(NIL)
+        self.parent.append(NIL)
+        self.height.append(0)
+        return len(self.items) - 1
+
+    def free_node(self, node: int) -> None:
+        self.items[node] = None
+        self.free.append(node)
+
+    def subtree_first(self, node: int) -> int:
+        left = self.left
+        while left[node] != NIL:
+            node = left[node]
+        return node
+
+    def subtree_last(self, node: int) -> int:
+        right = self.right
+        while right[node] != NIL:
+            node = right[node]
+        return node
+
+    def find_node(self, k) -> int:
+        # node id storing key k, NIL if there is none
+        items, left, right = self.items, self.left, self.right
+        node = self.root
+        while node != NIL:
+            key = items[node].key
+            if k < key:
+                node = left[node]
+            elif k > key:
+                node = right[node]
+            else:
+                return node
+        return NIL
+
+    def find_min(self):
+        """
+        Find and return the minimum element in the tree.
+
+        Returns:
+            Any: The minimum element in the tree.
+        """
+        if self.root == NIL:
+            raise ValueError("Tree is empty, cannot find minimum element.")
+        return self.items[self.subtree_first(self.root)]
+
+    def find_max(self):
+        """
+        Find and return the maximum element in the tree.
+
+        Returns:
+            Any: The maximum element in the tree.
+        """
+        if self.root == NIL:
+            raise ValueError("Tree is empty, cannot find maximum element.")
+        return self.items[self.subtree_last(self.root)]
+
+    def find(self, k):
+        """
+        Find an element with key k in the tree and return it if found.
+
+        Args:
+            k (Any): The key to search for.
+
+        Returns:
+            Any: The element with key k if found, otherwise None.
+        """
+        node = self.find_node(k)
+        if node != NIL:
+            return self.items[node]
+
+    def find_next(self, k):
+        """
+        Find the element with the smallest key that is greater than k.
+
+        Args:
+            k (Any): The key for which the successor is to be found.
+
+        Returns:
+            Any: The next element greater than k, if exists.
+        """
+        items, left, right = self.items, self.left, self.right
+        node, best = self.root, NIL
+        while node != NIL:
+            if items[node].key <= k:
+                node = right[node]
+            else:
+                best = node
+                node = left[node]
+        if best != NIL:
+            return self.items[best]
+
+    def find_prev(self, k):
+        """
+        Find the element with the largest key that is smaller than k.
+
+        Args:
+            k (Any): The key for which the predecessor is to be found.
+
+        Returns:
+            Any: The previous element smaller than k, if exists.
+        """
+        items, left, right = self.items, self.left, self.right
+        node, best = self.root, NIL
+        while node != NIL:
+            if items[node].key >= k:
+                node = left[node]
+            else:
+                best = node
+                node = right[node]
+        if best != NIL:
+            return self.items[best]
+
+    def insert(self, x) -> bool:
+        """
+        Insert a new element x into the tree.
+
+        Args:
+            x (Any): The element to insert into the tree.
+
+        Returns:
+            bool: True if new node was added, False if overwrite.
+        """
+        k = x.key
+        items, left, right = self.items, self.left, self.right
+        node, above = self.root, NIL
+        while node != NIL:
+            above = node
+            key = items[node].key
+            if k < key:
+                node = left[node]
+            elif k > key:
+                node = right[node]
+            else:
+                items[node] = x
+                return False
+        new = self.new_node(x)
+        self.parent[new] = above
+        if above == NIL:
+            self.root = new
+        elif k < items[above].key:
+            left[above] = new
+        else:
+            right[above] = new
+        self.size += 1
+        self.maintain(above)
+        return True
+
+    def delete(self, k):
+        """
+        Delete the element with key k from the tree.
+
+        Args:
+            k (Any): The key of the element to delete from the tree.
+
+        Returns:
+            Any: The deleted element.
+        """
+        if self.root == NIL:
+            raise ValueError("Tree is empty, cannot delete")
+        node = self.find_node(k)
+        if node == NIL:
+            raise ValueError(f"No item for key={k}")
+        removed = self.items[node]
+        left, right, parent = self.left, self.right, self.parent
+        if left[node] != NIL and right[node] != NIL:
+            # move the successor's item up, then unlink the successor instead
+            successor = self.subtree_first(right[node])
+            self.items[node] = self.items[successor]
+            node = successor
+        child = left[node] if left[node] != NIL else right[node]
+        above = parent[node]
+        if child != NIL:
+            parent[child] = above
+        self.replace_child(above, node, child)
+        self.free_node(node)
+        self.size -= 1
+        self.maintain(above)
+        return removed
+
+    def replace_child(self, above: int, old: int, new: int) -> None:
+        # make new take the place of old below above
+        if above == NIL:
+            self.root = new
+        elif self.left[above] == old:
+            self.left[above] = new
+        else:
+            self.right[above] = new
+
+    def subtree_update(self, node: int) -> None:
+        height = self.height
+        lh = height[self.left[node]] if self.left[node] != NIL else -1
+        rh = height[self.right[node]] if self.right[node] != NIL else -1
+        height[node] = 1 + (lh if lh > rh else rh)
+
+    def skew(self, node: int) -> int:
+        height = self.height
+        lh = height[self.left[node]] if self.left[node] != NIL else -1
+        rh = height[self.right[node]] if self.right[node] != NIL else -1
+        return rh - lh
+
+    def rotate_right(self, node: int) -> int:
+        # rotate node down to the right, returns the new subtree root
+        left, right, parent = self.left, self.right, self.parent
+        top = left[node]
+        middle = right[top]
+        above = parent[node]
+        left[node] = middle
+        if middle != NIL:
+            parent[middle] = node
+        right[top] = node
+        parent[node] = top
+        parent[top] = above
+        self.replace_child(above, node, top)
+        self.subtree_update(node)
+        self.subtree_update(top)
+        return top
+
+    def rotate_left(self, node: int) -> int:
+        # rotate node down to the left, returns the new subtree root
+        left, right, parent = self.left, self.right, self.parent
+        top = right[node]
+        middle = left[top]
+        above = parent[node]
+        right[node] = middle
+        if middle != NIL:
+            parent[middle] = node
+        left[top] = node
+        parent[node] = top
+        parent[top] = above
+        self.replace_child(above, node, top)
+        self.subtree_update(node)
+        self.subtree_update(top)
+        return top
+
+    def rebalance(self, node: int) -> int:
+        # restore the AVL property at node, returns the new subtree root
+        skew = self.skew(node)
+        if skew == 2:
+            if self.skew(self.right[node]) < 0:
+                self.rotate_right(self.right[node])
+            return self.rotate_left(node)
+        if skew == -2:
+            if self.skew(self.left[node]) > 0:
+                self.rotate_left(self.left[node])
+            return self.rotate_right(node)
+        return node
+
+    def maintain(self, node: int) -> None:
+        # rebalance and update heights on the path from node to the root,
+        # stopping early once a subtree height is unchanged
+        parent, height = self.parent, self.height
+        while node != NIL:
+            old_height = height[node]
+            node = self.rebalance(node)
+            self.subtree_update(node)
+            if height[node] == old_height:
+                return
+            node = parent[node]
+
+
+if __name__ == "__main__":
+    from collections import namedtuple
+
+    Item = namedtuple("Item", "key")
+    t = ArraySetBinaryTree()
+    t.build(Item(k) for k in [37, 13, 49, 12, 39, 11])
+    print([x.key for x in t])
+    t.delete(13)
+    print([x.key for x in t], t.find_next(12), t.find_prev(37))
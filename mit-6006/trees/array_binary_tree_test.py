@@ -0,0 +1,89 @@
+"""
+Tests for array_binary_tree.py
+"""
+
+import random
+import unittest
+from collections import namedtuple
+from array_binary_tree import ArraySetBinaryTree, NIL
+
+Item = namedtuple("Item", "key value", defaults=(None,))
+
+
+def check_invariants(test: unittest.TestCase, tree: ArraySetBinaryTree):
+    # every node has consistent parent links, correct height and |skew| <= 1
+    def visit(node, above):
+        if node == NIL:
+            return -1
+        test.assertEqual(tree.parent[node], above)
+        lh = visit(tree.left[node], node)
+        rh = visit(tree.right[node], node)
+        test.assertLessEqual(abs(rh - lh), 1)
+        test.assertEqual(tree.height[node], 1 + max(lh, rh))
+        return tree.height[node]
+
+    visit(tree.root, NIL)
+
+
+class TestArraySetBinaryTree(unittest.TestCase):
+
+    def test_empty(self):
+        tree = ArraySetBinaryTree()
+        self.assertEqual(len(tree), 0)
+        self.assertEqual(list(tree), [])
+        self.assertIsNone(tree.find(1))
+        self.assertIsNone(tree.find_next(1))
+        self.assertIsNone(tree.find_prev(1))
+        with self.assertRaises(ValueError):
+            tree.find_min()
+        with self.assertRaises(ValueError):
+            tree.delete(1)
+
+    def test_insert_overwrites_existing_key(self):
+        tree = ArraySetBinaryTree()
+        self.assertTrue(tree.insert(Item(3, "a")))
+        self.assertFalse(tree.insert(Item(3, "b")))
+        self.assertEqual(len(tree), 1)
+        self.assertEqual(tree.find(3).value, "b")
+
+    def test_find_next_and_prev(self):
+        tree = ArraySetBinaryTree()
+        tree.build(Item(k) for k in [37, 13, 49, 12, 39, 11])
+        self.assertEqual(tree.find_next(13).key, 37)
+        self.assertEqual(tree.find_next(14).key, 37)
+        self.assertIsNone(tree.find_next(49))
+        self.assertEqual(tree.find_prev(37).key, 13)
+        self.assertIsNone(tree.find_prev(11))
+        self.assertEqual(tree.find_min().key, 11)
+        self.assertEqual(tree.find_max().key, 49)
+
+    def test_sorted_inserts_stay_balanced(self):
+        tree = ArraySetBinaryTree()
+        tree.build(Item(k) for k in range(1000))
+        check_invariants(self, tree)
+        self.assertLessEqual(tree.height[tree.root], 14)
+
+    def test_random_operations_match_dict(self):
+        rng = random.Random(6006)
+        tree = ArraySetBinaryTree()
+        expected = {}
+        for _ in range(3000):
+            k = rng.randrange(300)
+            if rng.random() < 0.6:
+                tree.insert(Item(k, k))
+                expected[k] = k
+            elif k in expected:
+                self.assertEqual(tree.delete(k).key, k)
+                del expected[k]
+            else:
+                with self.assertRaises(ValueError):
+                    tree.delete(k)
+        check_invariants(self, tree)
+        self.assertEqual([x.key for x in tree], sorted(expected))
+        self.assertEqual(len(tree), len(expected))
+        # freed slots are reused rather than growing the columns
+        self.assertLessEqual(len(tree.items), 300)
+
+
+if __name__ == "__main__":
+    unittest.main()
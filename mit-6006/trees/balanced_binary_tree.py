@@ -11,6 +11,13 @@ def height(n: Optional[BinaryNode]) -> int:
         return -1
 
 
+def size(n: Optional[BinaryNode]) -> int:
+    if n:
+        return n.size
+    else:
+        return 0
+
+
 class BinaryNode:
     """
     A class representing a node in a binary tree.
@@ -20,11 +27,16 @@ class BinaryNode:
         left: The left child of the node.
         right: The right child of the node.
         parent: The parent of the node.
+        height: The height of the subtree rooted at the node.
+        size: The number of nodes in the subtree rooted at the node.
     """
 
+    __slots__ = ("item", "height", "size", "left", "right", "parent")
+
     def __init__(self, x: Any):
         self.item = x
         self.height: int = -1
+        self.size: int = 0
         self.left: Optional[BinaryNode] = None
         self.right: Optional[BinaryNode] = None
         self.parent: Optional[BinaryNode] = None
@@ -32,6 +44,7 @@ class BinaryNode:
 
     def subtree_update(self) -> None:
         self.height = 1 + max(height(self.left), height(self.right))
+        self.size = 1 + size(self.left) + size(self.right)
 
     def skew(self) -> int:
         return height(self.right) - height(self.left)
@@ -44,23 +57,27 @@ class BinaryNode:
         Yields:
             Node: The next node in the subtree.
         """
-        if self.left:
-            yield from self.left.subtree_iter()
-        yield self
-        if self.right:
-            yield from self.right.subtree_iter()
+        # explicit stack of nodes whose left subtree is being visited
+        stack, node = [], self
+        while stack or node:
+            while node:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node
+            node = node.right
 
     def subtree_first(self):
-        if self.left:
-            return self.left.subtree_first()
-        else:
-            return self
+        node = self
+        while node.left:
+            node = node.left
+        return node
 
     def subtree_last(self):
-        if self.right:
-            return self.right.subtree_last()
-        else:
-            return self
+        node = self
+        while node.right:
+            node = node.right
+        return node
 
     def successor(self):
         if self.right:
@@ -114,61 +131,68 @@ class BinaryNode:
         Returns:
             None
         """
-        item, height, left, right, parent = (
+        item, height, size, left, right, parent = (
             self.item,
             self.height,
+            self.size,
             self.left,
             self.right,
             self.parent,
         )
-        self.item, self.height, self.left, self.right, self.parent = (
+        self.item, self.height, self.size, self.left, self.right, self.parent = (
             other.item,
             other.height,
+            other.size,
             other.left,
             other.right,
             other.parent,
         )
-        other.item, other.height, other.left, other.right, other.parent = (
+        other.item, other.height, other.size, other.left, other.right, other.parent = (
             item,
             height,
+            size,
             left,
             right,
             parent,
         )
 
     def subtree_delete(self):
-        if self.left or self.right:
-            if self.left:
-                lower_node = self.predecessor()
+        # swap the item down until it sits in a leaf
+        node = self
+        while node.left or node.right:
+            if node.left:
+                lower_node = node.predecessor()
             else:
-                lower_node = self.successor()
-            lower_node.item, self.item = self.item, lower_node.item
-            return lower_node.subtree_delete()
-        # self is leaf
-        if self.parent:
-            if self.parent.left == self:
-                self.parent.left = None
+                lower_node = node.successor()
+            lower_node.item, node.item = node.item, lower_node.item
+            node = lower_node
+        if node.parent:
+            if node.parent.left == node:
+                node.parent.left = None
             else:
-                self.parent.right = None
-            self.parent.maintain()
-        return self
+                node.parent.right = None
+            node.parent.maintain()
+        return node
 
     def subtree_rotate_right(self):
+        # items are swapped so that self stays the root of the subtree,
+        # which keeps the links from the parent (or the tree) valid
         D = self
         B = D.left
         if B is None:
             raise ValueError(
                 "Cannot perform right rotation on a node without a left child."
             )
-        C = B.right
-        B.parent = D.parent
-        B.right = D
-        D.parent = B
-        D.left = C
-        if C:
-            C.parent = D
-        D.subtree_update()
+        A, C, E = B.left, B.right, D.right
+        D.item, B.item = B.item, D.item
+        D.left, D.right = A, B
+        B.left, B.right = C, E
+        if A:
+            A.parent = D
+        if E:
+            E.parent = B
         B.subtree_update()
+        D.subtree_update()
 
     def subtree_rotate_left(self):
         B = self
@@ -177,15 +201,16 @@ class BinaryNode:
             raise ValueError(
                 "Cannot perform left rotation on a node without a right child."
             )
-        C = D.left
-        D.parent = B.parent
-        D.left = B
-        B.parent = D
-        B.right = C
-        if C:
-            C.parent = B
-        B.subtree_update()
+        A, C, E = B.left, D.left, D.right
+        B.item, D.item = D.item, B.item
+        B.left, B.right = D, E
+        D.left, D.right = A, C
+        if A:
+            A.parent = D
+        if E:
+            E.parent = B
         D.subtree_update()
+        B.subtree_update()
 
     def rebalance(self):
         if self.skew() == 2:
@@ -198,10 +223,69 @@ class BinaryNode:
             self.subtree_rotate_right()
 
     def maintain(self):
-        self.rebalance()
+        node = self
+        while node:
+            node.rebalance()
+            node.subtree_update()
+            node = node.parent
+
+    def subtree_join(
+        self, left: Optional[BinaryNode], right: Optional[BinaryNode]
+    ) -> BinaryNode:
+        """
+        Joins two balanced subtrees with self placed between them in
+        traversal order, in O(1 + |height(left) - height(right)|) time.
+
+        Args:
+            left (Optional[BinaryNode]): Root of the subtree to come before self.
+            right (Optional[BinaryNode]): Root of the subtree to come after self.
+
+        Returns:
+            BinaryNode: The root of the joined subtree, which has no parent.
+        """
+        if height(left) > height(right) + 1:
+            # hang self and right from the right spine of left
+            left.right = self.subtree_join(left.right, right)
+            left.right.parent = left
+            left.rebalance()
+            left.subtree_update()
+            left.parent = None
+            return left
+        if height(right) > height(left) + 1:
+            right.left = self.subtree_join(left, right.left)
+            right.left.parent = right
+            right.rebalance()
+            right.subtree_update()
+            right.parent = None
+            return right
+        self.left, self.right, self.parent = left, right, None
+        if left:
+            left.parent = self
+        if right:
+            right.parent = self
         self.subtree_update()
-        if self.parent:
-            self.parent.maintain()
+        return self
+
+    def subtree_split_last(self) -> tuple[Optional[BinaryNode], BinaryNode]:
+        """
+        Detaches the last node in traversal order from the subtree rooted
+        at self, which has no parent, in O(log n) time.
+
+        Returns:
+            tuple: Root of the balanced subtree of the remaining nodes,
+                and the detached last node.
+        """
+        left, right = self.left, self.right
+        self.left = self.right = None
+        if left:
+            left.parent = None
+        if right:
+            right.parent = None
+        if not right:
+            self.subtree_update()
+            return left, self
+        rest, last = right.subtree_split_last()
+        return self.subtree_join(left, rest), last
 
     def __str__(self) -> str:
         return self.subtree_2d()
@@ -281,79 +365,102 @@ def construct_binary_tree(seq: list[Any]) -> BinaryTree:
     return b
 
 
-def construct_binary_tree_rec(seq: list[Any], l, r) -> Optional[BinaryNode]:
+def construct_binary_tree_rec(
+    seq: list[Any], l, r, node_type=BinaryNode
+) -> Optional[BinaryNode]:
     # recursively construct binary tree from items in A[l:r]
     if l >= r:
         return None
     c = (l + r) // 2
-    root = BinaryNode(seq[c])
+    root = node_type(seq[c])
     if l < c:
-        root.left = construct_binary_tree_rec(seq, l, c)
+        root.left = construct_binary_tree_rec(seq, l, c, node_type)
         root.left.parent = root
     if c + 1 < r:
-        root.right = construct_binary_tree_rec(seq, c + 1, r)
+        root.right = construct_binary_tree_rec(seq, c + 1, r, node_type)
         root.right.parent = root
+    root.subtree_update()
     return root
 
 
 class BSTNode(BinaryNode):
 
+    __slots__ = ()
+
     left: BSTNode
     right: BSTNode
 
     def subtree_find(self, k) -> Optional[BSTNode]:
-        # find node storing k else find predecessor
-        if k == self.item.key:
-            return self
-        if k < self.item.key:
-            subtree = self.left
-        if k > self.item.key:
-            subtree = self.right
-        if subtree:
-            return subtree.subtree_find(k)
-        else:
-            return None
+        # find node storing k, None if there is none
+        node = self
+        while node:
+            if k < node.item.key:
+                node = node.left
+            elif k > node.item.key:
+                node = node.right
+            else:
+                return node
+        return None
 
     def subtree_find_next(self, k):
-        # find k if its in tree or its predecessor in traversal order
-        if self.item.key <= k:
-            if self.right:
-                return self.right.subtree_find_next(k)
+        # find the node with the smallest key greater than k
+        node, best = self, None
+        while node:
+            if node.item.key <= k:
+                node = node.right
             else:
-                return None
-        elif self.left:
-            n = self.left.subtree_find_next(k)
-            if n:
-                return n
-        return self
+                best = node
+                node = node.left
+        return best
 
     def subtree_find_prev(self, k):
-        if self.item.key >= k:
-            # if prev exists it is in left subtree
-            if self.left:
-                return self.left.subtree_find_prev(k)
+        # find the node with the largest key smaller than k
+        node, best = self, None
+        while node:
+            if node.item.key >= k:
+                node = node.left
             else:
-                return None
-        # self.item.key < k
-        elif self.right:
-            n = self.right.subtree_find_prev(k)
-            if n:
-                return n
-        return self
+                best = node
+                node = node.right
+        return best
+
+    def subtree_split(self, k) -> tuple[Optional[BSTNode], Optional[BSTNode]]:
+        """
+        Splits the subtree rooted at self, which has no parent, into the
+        nodes with key < k and those with key >= k, in O(log n) time.
+
+        Returns:
+            tuple: Roots of the balanced subtrees of both parts.
+        """
+        left, right = self.left, self.right
+        self.left = self.right = None
+        if left:
+            left.parent = None
+        if right:
+            right.parent = None
+        if k <= self.item.key:
+            first, rest = left.subtree_split(k) if left else (None, None)
+            return first, self.subtree_join(rest, right)
+        first, rest = right.subtree_split(k) if right else (None, None)
+        return self.subtree_join(left, first), rest
 
     def subtree_insert(self, new_node):
-        if new_node.item.key < self.item.key:
-            if self.left:
-                self.left.subtree_insert(new_node)
+        # overwrites the item of the node with an equal key, if there is one
+        node = self
+        while True:
+            if new_node.item.key < node.item.key:
+                if not node.left:
+                    node.subtree_insert_before(new_node)
+                    return
+                node = node.left
+            elif new_node.item.key > node.item.key:
+                if not node.right:
+                    node.subtree_insert_after(new_node)
+                    return
+                node = node.right
             else:
-                self.subtree_insert_before(new_node)
-        if new_node.item.key > self.item.key:
-            if self.right:
-                self.right.subtree_insert(new_node)
-            else:
-                self.subtree_insert_after(new_node)
-        else:
-            self.item = new_node.item
+                node.item = new_node.item
+                return
 
 
 class SetBinaryTree(BinaryTree):
@@ -386,8 +493,70 @@ class SetBinaryTree(BinaryTree):
         Args:
             X (iterable): An iterable collection of elements to be inserted into the tree.
         """
+        self.bulk_insert(X)
+
+    def build_sorted(self, X: Any):
+        """
+        Replace the contents of the tree with the elements of X in O(n) time.
+
+        Args:
+            X (iterable): Elements sorted by key. Of several elements with
+                the same key the last one is kept.
+
+        Raises:
+            ValueError: If the elements are not sorted by key.
+        """
+        items = []
         for x in X:
-            self.insert(x)
+            if items and x.key <= items[-1].key:
+                if x.key < items[-1].key:
+                    raise ValueError("Elements must be sorted by key.")
+                items[-1] = x
+            else:
+                items.append(x)
+        self.root = construct_binary_tree_rec(items, 0, len(items), self.node_type)
+        self.size = len(items)
+
+    def bulk_insert(self, batch: Any) -> int:
+        """
+        Insert all elements of batch, as if by insert, in
+        O(min(n, m log n) + m log m) time.
+
+        A batch of m elements that is large next to the n items already in
+        the tree, with m log n >= n, is sorted and merged with the items in
+        the tree, and the tree is then rebuilt balanced from the merged
+        sequence. A smaller batch is inserted one element at a time, which
+        keeps the existing nodes.
+
+        Args:
+            batch (iterable): The elements to insert into the tree.
+
+        Returns:
+            int: The number of new nodes added.
+        """
+        batch = sorted(batch, key=lambda x: x.key)
+        if not batch:
+            return 0
+        if len(batch) * self.size.bit_length() < self.size:
+            return sum(self.insert(x) for x in batch)
+        existing = [node.item for node in self]
+        merged = []
+        i = 0
+        for x in batch:
+            while i < len(existing) and existing[i].key < x.key:
+                merged.append(existing[i])
+                i += 1
+            if i < len(existing) and existing[i].key == x.key:
+                # element from the batch overwrites the existing one
+                i += 1
+            if merged and merged[-1].key == x.key:
+                merged[-1] = x
+            else:
+                merged.append(x)
+        merged.extend(existing[i:])
+        added = len(merged) - self.size
+        self.build_sorted(merged)
+        return added
 
     def find_min(self):
         """
@@ -456,6 +625,132 @@ class SetBinaryTree(BinaryTree):
             if n:
                 return n.item
 
+    def rank(self, k) -> int:
+        """
+        Count the elements whose key is smaller than k in O(log n) time.
+
+        Args:
+            k (Any): The key to rank.
+
+        Returns:
+            int: The number of elements with key < k.
+        """
+        node, r = self.root, 0
+        while node:
+            if k <= node.item.key:
+                node = node.left
+            else:
+                r += size(node.left) + 1
+                node = node.right
+        return r
+
+    def select(self, i: int):
+        """
+        Find the element at index i in key order in O(log n) time.
+
+        Args:
+            i (int): The index of the element, 0 <= i < len(self).
+
+        Returns:
+            Any: The element with exactly i smaller keys in the tree.
+        """
+        if not 0 <= i < self.size:
+            raise IndexError(f"No element at index {i}")
+        node = self.root
+        while True:
+            left_size = size(node.left)
+            if i < left_size:
+                node = node.left
+            elif i > left_size:
+                i -= left_size + 1
+                node = node.right
+            else:
+                return node.item
+
+    def count_range(self, lo, hi) -> int:
+        """
+        Count the elements with lo <= key < hi in O(log n) time.
+
+        Args:
+            lo (Any): The inclusive lower bound of the keys.
+            hi (Any): The exclusive upper bound of the keys.
+
+        Returns:
+            int: The number of elements with a key in [lo, hi).
+        """
+        return max(0, self.rank(hi) - self.rank(lo))
+
+    def iter_range(self, lo, hi):
+        """
+        Iterate over the nodes with lo <= key < hi in inorder traversal,
+        in O(log n) time plus constant time per node.
+
+        Args:
+            lo (Any): The inclusive lower bound of the keys.
+            hi (Any): The exclusive upper bound of the keys.
+
+        Yields:
+            Node: Nodes in the key range in inorder traversal.
+        """
+        # stack holds the ancestors still to be visited, smallest on top
+        stack, node = [], self.root
+        while node:
+            if node.item.key < lo:
+                node = node.right
+            else:
+                stack.append(node)
+                node = node.left
+        while stack:
+            node = stack.pop()
+            if not node.item.key < hi:
+                return
+            yield node
+            node = node.right
+            while node:
+                stack.append(node)
+                node = node.left
+
+    def split(self, k) -> tuple[SetBinaryTree, SetBinaryTree]:
+        """
+        Split the elements of the tree at key k in O(log n) time.
+        The tree itself is left empty.
+
+        Args:
+            k (Any): The key to split at.
+
+        Returns:
+            tuple: A tree of the elements with key < k
+                and a tree of the elements with key >= k.
+        """
+        first, rest = self.root.subtree_split(k) if self.root else (None, None)
+        left, right = SetBinaryTree(), SetBinaryTree()
+        left.root, left.size = first, size(first)
+        right.root, right.size = rest, size(rest)
+        self.root, self.size = None, 0
+        return left, right
+
+    def join(self, right: SetBinaryTree) -> SetBinaryTree:
+        """
+        Move all elements of right into this tree in O(log n) time.
+        Every key in right must be greater than every key in this tree.
+
+        Args:
+            right (SetBinaryTree): The tree to join, which is left empty.
+
+        Returns:
+            SetBinaryTree: This tree.
+        """
+        if self.root and right.root:
+            if self.find_max().key >= right.find_min().key:
+                raise ValueError("Keys of the right tree must be greater.")
+            rest, last = self.root.subtree_split_last()
+            self.root = last.subtree_join(rest, right.root)
+        elif right.root:
+            self.root = right.root
+        self.size += right.size
+        right.root, right.size = None, 0
+        return self
+
     def insert(self, x):
         """
         Insert a new element x into the tree.
@@ -475,6 +770,7 @@ class SetBinaryTree(BinaryTree):
         else:
             self.root = new_node
         self.size += 1
+        return True
 
     def delete(self, k):
         """
@@ -0,0 +1,162 @@
+"""
+Tests for balanced_binary_tree.py
+"""
+
+import random
+import unittest
+from collections import namedtuple
+from balanced_binary_tree import SetBinaryTree, height, size
+
+Item = namedtuple("Item", "key value", defaults=(None,))
+
+
+def check_invariants(test: unittest.TestCase, tree: SetBinaryTree):
+    # parent links, heights and the AVL property hold for every node
+    if tree.root is None:
+        test.assertEqual(len(tree), 0)
+        return
+    test.assertIsNone(tree.root.parent)
+    for node in tree.root.subtree_iter():
+        for child in (node.left, node.right):
+            if child:
+                test.assertIs(child.parent, node)
+        test.assertEqual(node.height, 1 + max(height(node.left), height(node.right)))
+        test.assertEqual(node.size, 1 + size(node.left) + size(node.right))
+        test.assertLessEqual(abs(node.skew()), 1)
+    keys = [n.item.key for n in tree]
+    test.assertEqual(keys, sorted(keys))
+    test.assertEqual(len(keys), len(tree))
+
+
+def build(keys) -> SetBinaryTree:
+    tree = SetBinaryTree()
+    tree.build(Item(k) for k in keys)
+    return tree
+
+
+class TestSetBinaryTree(unittest.TestCase):
+
+    def test_insert_overwrites_existing_key(self):
+        tree = SetBinaryTree()
+        self.assertTrue(tree.insert(Item(3, "a")))
+        self.assertTrue(tree.insert(Item(1, "b")))
+        self.assertFalse(tree.insert(Item(3, "c")))
+        self.assertEqual(len(tree), 2)
+        self.assertEqual(tree.find(3).value, "c")
+        self.assertEqual(tree.find(1).value, "b")
+
+    def test_find_next_and_prev(self):
+        tree = build([37, 13, 49, 12, 39, 11])
+        self.assertEqual(tree.find_next(13).key, 37)
+        self.assertEqual(tree.find_next(14).key, 37)
+        self.assertIsNone(tree.find_next(49))
+        self.assertEqual(tree.find_prev(37).key, 13)
+        self.assertIsNone(tree.find_prev(11))
+        self.assertIsNone(tree.find(20))
+
+    def test_sorted_inserts_stay_balanced(self):
+        tree = build(range(5000))
+        check_invariants(self, tree)
+        self.assertLessEqual(tree.root.height, 17)
+        self.assertEqual(tree.find_min().key, 0)
+        self.assertEqual(tree.find_max().key, 4999)
+
+    def test_build_sorted(self):
+        tree = SetBinaryTree()
+        tree.build_sorted(Item(k, k) for k in [1, 2, 2, 5, 8, 13])
+        check_invariants(self, tree)
+        self.assertEqual([n.item.key for n in tree], [1, 2, 5, 8, 13])
+        with self.assertRaises(ValueError):
+            tree.build_sorted([Item(2), Item(1)])
+
+    def test_bulk_insert_merges_with_existing(self):
+        tree = build(range(0, 100, 2))
+        added = tree.bulk_insert(Item(k, "new") for k in range(150, -1, -3))
+        check_invariants(self, tree)
+        expected = set(range(0, 100, 2)) | set(range(0, 151, 3))
+        self.assertEqual(added, len(expected) - 50)
+        self.assertEqual([n.item.key for n in tree], sorted(expected))
+        self.assertEqual(tree.find(6).value, "new")
+        self.assertIsNone(tree.find(4).value)
+        tree.insert(Item(1000))
+        tree.delete(0)
+        check_invariants(self, tree)
+
+    def test_small_bulk_insert_keeps_nodes(self):
+        tree = build(range(0, 2000, 2))
+        nodes = {n.item.key: n for n in tree}
+        added = tree.bulk_insert([Item(7, "a"), Item(4, "new"), Item(7, "b")])
+        check_invariants(self, tree)
+        self.assertEqual(added, 1)
+        self.assertEqual(len(tree), 1001)
+        self.assertEqual(tree.find(7).value, "b")
+        self.assertEqual(tree.find(4).value, "new")
+        self.assertTrue(all(n in nodes.values() for n in tree if n.item.key != 7))
+
+    def test_rank_and_select(self):
+        keys = list(range(0, 300, 3))
+        tree = build(reversed(keys))
+        for i, k in enumerate(keys):
+            self.assertEqual(tree.rank(k), i)
+            self.assertEqual(tree.rank(k + 1), i + 1)
+            self.assertEqual(tree.select(i).key, k)
+        self.assertEqual(tree.rank(-5), 0)
+        with self.assertRaises(IndexError):
+            tree.select(len(keys))
+
+    def test_count_and_iter_range(self):
+        rng = random.Random(2020)
+        keys = rng.sample(range(1000), 400)
+        tree = build(keys)
+        for _ in range(100):
+            lo, hi = rng.randrange(-10, 1010), rng.randrange(-10, 1010)
+            expected = sorted(k for k in keys if lo <= k < hi)
+            self.assertEqual(tree.count_range(lo, hi), len(expected))
+            self.assertEqual([n.item.key for n in tree.iter_range(lo, hi)], expected)
+
+    def test_split_and_join(self):
+        rng = random.Random(42)
+        keys = rng.sample(range(1000), 500)
+        for k in [-1, 0, 250, 501, 999, 1000]:
+            tree = build(keys)
+            left, right = tree.split(k)
+            self.assertEqual(len(tree), 0)
+            check_invariants(self, left)
+            check_invariants(self, right)
+            self.assertEqual([n.item.key for n in left], sorted(x for x in keys if x < k))
+            self.assertEqual([n.item.key for n in right], sorted(x for x in keys if x >= k))
+            joined = SetBinaryTree.join(left, right)
+            self.assertIs(joined, left)
+            self.assertEqual(len(right), 0)
+            check_invariants(self, joined)
+            self.assertEqual([n.item.key for n in joined], sorted(keys))
+
+    def test_join_unbalanced_sizes(self):
+        small, large = build([-3, -2]), build(range(1000))
+        small.join(large)
+        check_invariants(self, small)
+        self.assertEqual(len(small), 1002)
+        with self.assertRaises(ValueError):
+            build([5]).join(build([5, 6]))
+
+    def test_random_operations_match_dict(self):
+        rng = random.Random(6006)
+        tree = SetBinaryTree()
+        expected = set()
+        for _ in range(2000):
+            k = rng.randrange(200)
+            if rng.random() < 0.6:
+                tree.insert(Item(k))
+                expected.add(k)
+            elif k in expected:
+                self.assertEqual(tree.delete(k).key, k)
+                expected.remove(k)
+            else:
+                with self.assertRaises(ValueError):
+                    tree.delete(k)
+        check_invariants(self, tree)
+        self.assertEqual([n.item.key for n in tree], sorted(expected))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -29,23 +29,27 @@ class BinaryNode:
         Yields:
             Node: The next node in the subtree.
         """
-        if self.left:
-            yield from self.left.subtree_iter()
-        yield self
-        if self.right:
-            yield from self.right.subtree_iter()
+        # explicit stack of nodes whose left subtree is being visited
+        stack, node = [], self
+        while stack or node:
+            while node:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node
+            node = node.right
 
     def subtree_first(self):
-        if self.left:
-            return self.left.subtree_first()
-        else:
-            return self
+        node = self
+        while node.left:
+            node = node.left
+        return node
 
     def subtree_last(self):
-        if self.right:
-            return self.right.subtree_last()
-        else:
-            return self
+        node = self
+        while node.right:
+            node = node.right
+        return node
 
     def successor(self):
         if self.right:
@@ -86,20 +90,21 @@ class BinaryNode:
         return self.left is None and self.right is None
 
     def subtree_delete(self):
-        if self.left or self.right:
-            if self.left:
-                lower_node = self.predecessor()
+        # swap the item down until it sits in a leaf
+        node = self
+        while node.left or node.right:
+            if node.left:
+                lower_node = node.predecessor()
             else:
-                lower_node = self.successor()
-            self.item, lower_node.item = lower_node.item, self.item
-            return lower_node.subtree_delete()
-        # self is leaf
-        if self.parent:
-            if self.parent.left == self:
-                self.parent.left = None
+                lower_node = node.successor()
+            node.item, lower_node.item = lower_node.item, node.item
+            node = lower_node
+        if node.parent:
+            if node.parent.left == node:
+                node.parent.left = None
             else:
-                self.parent.right = None
-        return self
+                node.parent.right = None
+        return node
 
     def __str__(self) -> str:
         return self.subtree_2d()
@@ -200,58 +205,56 @@ class BSTNode(BinaryNode):
     right: BSTNode
 
     def subtree_find(self, k) -> Optional[BSTNode]:
-        # find node storing k else find predecessor
-        if k == self.item.key:
-            return self
-        if k < self.item.key:
-            subtree = self.left
-        if k > self.item.key:
-            subtree = self.right
-        if subtree:
-            return subtree.subtree_find(k)
-        else:
-            return None
+        # find node storing k, None if there is none
+        node = self
+        while node:
+            if k < node.item.key:
+                node = node.left
+            elif k > node.item.key:
+                node = node.right
+            else:
+                return node
+        return None
 
     def subtree_find_next(self, k):
-        # find k if its in tree or its predecessor in traversal order
-        if self.item.key <= k:
-            if self.right:
-                return self.right.subtree_find_next(k)
+        # find the node with the smallest key greater than k
+        node, best = self, None
+        while node:
+            if node.item.key <= k:
+                node = node.right
             else:
-                return None
-        elif self.left:
-            n = self.left.subtree_find_next(k)
-            if n:
-                return n
-        return self
+                best = node
+                node = node.left
+        return best
 
     def subtree_find_prev(self, k):
-        if self.item.key >= k:
-            # if prev exists it is in left subtree
-            if self.left:
-                return self.left.subtree_find_prev(k)
+        # find the node with the largest key smaller than k
+        node, best = self, None
+        while node:
+            if node.item.key >= k:
+                node = node.left
             else:
-                return None
-        # self.item.key < k
-        elif self.right:
-            n = self.right.subtree_find_prev(k)
-            if n:
-                return n
-        return self
+                best = node
+                node = node.right
+        return best
 
     def subtree_insert(self, new_node):
-        if new_node.item.key < self.item.key:
-            if self.left:
-                self.left.subtree_insert(new_node)
-            else:
-                self.subtree_insert_before(new_node)
-        if new_node.item.key > self.item.key:
-            if self.right:
-                self.right.subtree_insert(new_node)
+        # overwrites the item of the node with an equal key, if there is one
+        node = self
+        while True:
+            if new_node.item.key < node.item.key:
+                if not node.left:
+                    node.subtree_insert_before(new_node)
+                    return
+                node = node.left
+            elif new_node.item.key > node.item.key:
+                if not node.right:
+                    node.subtree_insert_after(new_node)
+                    return
+                node = node.right
             else:
-                self.subtree_insert_after(new_node)
-        else:
-            self.item = new_node.item
+                node.item = new_node.item
+                return
 
 
 class SetBinaryTree(BinaryTree):
@@ -373,6 +376,7 @@ class SetBinaryTree(BinaryTree):
         else:
             self.root = new_node
         self.size += 1
+        return True
 
     def delete(self, k):
         """
@@ -0,0 +1,279 @@
+"""This module implements a sequence on top of a balanced binary tree."""
+
+from __future__ import annotations
+from typing import Any, Optional
+from balanced_binary_tree import (
+    BinaryNode,
+    BinaryTree,
+    construct_binary_tree_rec,
+    size,
+)
+
+
+class SequenceNode(BinaryNode):
+    """
+    A node of a sequence binary tree.
+
+    The traversal order of the tree is the sequence order. A subtree can be
+    reversed lazily: the flipped flag means left and right still have to be
+    swapped throughout the subtree, which push() does one level at a time
+    before the children of a node are looked at.
+
+    Attributes:
+        flipped: Whether the subtree rooted at the node is stored reversed.
+    """
+
+    __slots__ = ("flipped",)
+
+    left: SequenceNode
+    right: SequenceNode
+
+    def __init__(self, x: Any):
+        self.flipped = False
+        super().__init__(x)
+
+    def push(self) -> None:
+        # apply a pending reversal to this node and hand it to the children
+        if self.flipped:
+            self.left, self.right = self.right, self.left
+            if self.left:
+                self.left.flipped = not self.left.flipped
+            if self.right:
+                self.right.flipped = not self.right.flipped
+            self.flipped = False
+
+    def subtree_at(self, i: int) -> SequenceNode:
+        # find the node at index i of the subtree's traversal order
+        node = self
+        while True:
+            node.push()
+            left_size = size(node.left)
+            if i < left_size:
+                node = node.left
+            elif i > left_size:
+                i -= left_size + 1
+                node = node.right
+            else:
+                return node
+
+    def subtree_rotate_right(self):
+        self.push()
+        if self.left:
+            self.left.push()
+        super().subtree_rotate_right()
+
+    def subtree_rotate_left(self):
+        self.push()
+        if self.right:
+            self.right.push()
+        super().subtree_rotate_left()
+
+    def subtree_join(
+        self, left: Optional[SequenceNode], right: Optional[SequenceNode]
+    ) -> SequenceNode:
+        self.push()
+        if left:
+            left.push()
+        if right:
+            right.push()
+        return super().subtree_join(left, right)
+
+
+def split(
+    node: Optional[SequenceNode], i: int
+) -> tuple[Optional[SequenceNode], Optional[SequenceNode]]:
+    """
+    Splits the subtree rooted at node into its first i nodes and the rest,
+    in O(log n) time.
+
+    Args:
+        node (Optional[SequenceNode]): Root of the subtree, which has no parent.
+        i (int): The number of nodes to put into the first part.
+
+    Returns:
+        tuple: Roots of the subtrees holding the first i and the remaining nodes.
+    """
+    if node is None:
+        return None, None
+    node.push()
+    left, right = node.left, node.right
+    node.left = node.right = None
+    if left:
+        left.parent = None
+    if right:
+        right.parent = None
+    if i <= size(left):
+        first, rest = split(left, i)
+        return first, node.subtree_join(rest, right)
+    first, rest = split(right, i - size(left) - 1)
+    return node.subtree_join(left, first), rest
+
+
+def join(
+    left: Optional[SequenceNode], right: Optional[SequenceNode]
+) -> Optional[SequenceNode]:
+    """
+    Concatenates two subtrees, neither of which has a parent, in O(log n) time.
+
+    Returns:
+        Optional[SequenceNode]: Root of the subtree holding left followed by right.
+    """
+    if not left:
+        return right
+    if not right:
+        return left
+    left, last = split(left, size(left) - 1)
+    return last.subtree_join(left, right)
+
+
+class SequenceBinaryTree(BinaryTree):
+    """
+    Sequence of items supporting access, insertion and deletion at an index,
+    and reversing or moving a range of items, each in O(log n) time.
+    """
+
+    root: Optional[SequenceNode]
+
+    def __init__(self):
+        super().__init__(SequenceNode)
+
+    def __iter__(self):
+        """
+        Iterate over the items in sequence order.
+
+        Yields:
+            Any: The next item in the sequence.
+        """
+        stack, node = [], self.root
+        while stack or node:
+            while node:
+                node.push()
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node.item
+            node = node.right
+
+    def set_root(self, root: Optional[SequenceNode]) -> None:
+        self.root = root
+        self.size = size(root)
+
+    def check_index(self, i: int, n: int) -> None:
+        if not 0 <= i < n:
+            raise IndexError(f"Index {i} out of range for sequence of length {n}")
+
+    def build(self, X: Any):
+        """
+        Build the sequence from the items of X in O(n) time.
+
+        Args:
+            X (iterable): The items of the sequence, in order.
+        """
+        items = list(X)
+        self.set_root(
+            construct_binary_tree_rec(items, 0, len(items), self.node_type)
+        )
+
+    def get_at(self, i: int):
+        self.check_index(i, self.size)
+        return self.root.subtree_at(i).item
+
+    def set_at(self, i: int, x: Any):
+        self.check_index(i, self.size)
+        self.root.subtree_at(i).item = x
+
+    def insert_at(self, i: int, x: Any):
+        """
+        Insert x so that it becomes the item at index i.
+
+        Args:
+            i (int): The index of the new item, 0 <= i <= len(self).
+            x (Any): The item to insert.
+        """
+        self.check_index(i, self.size + 1)
+        first, rest = split(self.root, i)
+        self.set_root(self.node_type(x).subtree_join(first, rest))
+
+    def delete_at(self, i: int):
+        """
+        Remove and return the item at index i.
+
+        Args:
+            i (int): The index of the item to remove.
+
+        Returns:
+            Any: The removed item.
+        """
+        self.check_index(i, self.size)
+        first, rest = split(self.root, i)
+        removed, rest = split(rest, 1)
+        self.set_root(join(first, rest))
+        return removed.item
+
+    def insert_first(self, x: Any):
+        self.insert_at(0, x)
+
+    def insert_last(self, x: Any):
+        self.insert_at(self.size, x)
+
+    def delete_first(self):
+        return self.delete_at(0)
+
+    def delete_last(self):
+        return self.delete_at(self.size - 1)
+
+    def reverse(self, i: int, k: int):
+        """
+        Reverse the order of the k items starting at index i
+        (up to index i + k - 1).
+
+        Args:
+            i (int): The starting index of the range to reverse.
+            k (int): The number of items to reverse.
+        """
+        if k <= 0:
+            return
+        self.check_index(i + k - 1, self.size)
+        first, rest = split(self.root, i)
+        middle, last = split(rest, k)
+        middle.flipped = not middle.flipped
+        self.set_root(join(join(first, middle), last))
+
+    def move(self, i: int, k: int, j: int):
+        """
+        Move the k items starting at index i, in order,
+        to be in front of the item at index j.
+
+        Args:
+            i (int): The starting index of the range to move.
+            k (int): The number of items to move.
+            j (int): Index of the item the range is moved in front of,
+                outside of the range itself; len(self) moves it to the end.
+
+        Raises:
+            IndexError: If i ≤ j < i + k or an index is out of range.
+        """
+        if k <= 0:
+            return
+        self.check_index(i + k - 1, self.size)
+        self.check_index(j, self.size + 1)
+        if i <= j < i + k:
+            raise IndexError("Cannot move a range in front of one of its items")
+        first, rest = split(self.root, i)
+        middle, last = split(rest, k)
+        remaining = join(first, last)
+        # index of the item originally at j once the range is cut out
+        if j > i:
+            j -= k
+        before, after = split(remaining, j)
+        self.set_root(join(join(before, middle), after))
+
+
+if __name__ == "__main__":
+    D = SequenceBinaryTree()
+    D.build("halo")
+    D.reverse(1, 3)
+    print("".join(D))
+    D.build("abcdqqq")
+    D.move(2, 2, 5)
+    print("".join(D))
@@ -0,0 +1,94 @@
+"""
+Tests for sequence_binary_tree.py
+"""
+
+import random
+import unittest
+from balanced_binary_tree import height, size
+from sequence_binary_tree import SequenceBinaryTree
+
+
+def check_invariants(test: unittest.TestCase, seq: SequenceBinaryTree):
+    # parent links, heights, sizes and the AVL property hold for every node
+    def visit(node, above):
+        if node is None:
+            return
+        test.assertIs(node.parent, above)
+        visit(node.left, node)
+        visit(node.right, node)
+        test.assertEqual(node.height, 1 + max(height(node.left), height(node.right)))
+        test.assertEqual(node.size, 1 + size(node.left) + size(node.right))
+        test.assertLessEqual(abs(node.skew()), 1)
+
+    visit(seq.root, None)
+    test.assertEqual(len(seq), size(seq.root))
+
+
+class TestSequenceBinaryTree(unittest.TestCase):
+
+    def test_reverse_and_move(self):
+        seq = SequenceBinaryTree()
+        seq.build("halo")
+        seq.reverse(1, 3)
+        self.assertEqual("".join(seq), "hola")
+        seq.build("qqqabcd")
+        seq.move(4, 3, 2)
+        self.assertEqual("".join(seq), "qqbcdqa")
+        seq.build("abcdqqq")
+        seq.move(0, 2, 7)
+        self.assertEqual("".join(seq), "cdqqqab")
+        with self.assertRaises(IndexError):
+            seq.move(1, 3, 2)
+
+    def test_index_errors(self):
+        seq = SequenceBinaryTree()
+        with self.assertRaises(IndexError):
+            seq.get_at(0)
+        seq.insert_at(0, "x")
+        with self.assertRaises(IndexError):
+            seq.delete_at(1)
+        self.assertEqual(seq.delete_at(0), "x")
+        self.assertEqual(len(seq), 0)
+
+    def test_random_operations_match_list(self):
+        rng = random.Random(6006)
+        seq = SequenceBinaryTree()
+        expected = list(range(50))
+        seq.build(expected)
+        for step in range(3000):
+            n = len(expected)
+            op = rng.randrange(6)
+            if op == 0 or n < 2:
+                i = rng.randrange(n + 1)
+                seq.insert_at(i, step)
+                expected.insert(i, step)
+            elif op == 1:
+                i = rng.randrange(n)
+                self.assertEqual(seq.delete_at(i), expected.pop(i))
+            elif op == 2:
+                i = rng.randrange(n)
+                self.assertEqual(seq.get_at(i), expected[i])
+                seq.set_at(i, -step)
+                expected[i] = -step
+            elif op == 3:
+                i = rng.randrange(n)
+                k = rng.randrange(n - i + 1)
+                seq.reverse(i, k)
+                expected[i : i + k] = expected[i : i + k][::-1]
+            else:
+                i = rng.randrange(n - 1)
+                k = rng.randrange(1, n - i)
+                j = rng.choice([x for x in range(n + 1) if not i <= x < i + k])
+                seq.move(i, k, j)
+                moved = expected[i : i + k]
+                del expected[i : i + k]
+                at = j if j < i else j - k
+                expected[at:at] = moved
+            if step % 500 == 0:
+                check_invariants(self, seq)
+        check_invariants(self, seq)
+        self.assertEqual(list(seq), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()